@@ -12,10 +12,17 @@ class Settings(BaseSettings):
     debug: bool = False
     host: str = "0.0.0.0"
     port: int = 8001
+    workers: int = 4
     mongodb_url: str = "mongodb://localhost:27017"
     database_name: str = "asset_classes_db"
     collection_name: str = "asset_classes"
+    mongodb_max_pool_size: int = 200
+    mongodb_min_pool_size: int = 10
+    mongodb_max_idle_time_ms: int = 300_000
+    mongodb_server_selection_timeout_ms: int = 5000
+    mongodb_wait_queue_timeout_ms: int = 2500
     redis_url: Optional[str] = None
+    cache_ttl_seconds: int = 60
 
     class Config:
         env_file = ".env"
@@ -1,8 +1,12 @@
+from .cache import close_redis_connection, connect_to_redis, get_redis
 from .connection import connect_to_mongodb, close_mongodb_connection, get_database, get_collection
 
 __all__ = [
     "connect_to_mongodb",
     "close_mongodb_connection",
     "get_database",
-    "get_collection"
+    "get_collection",
+    "connect_to_redis",
+    "close_redis_connection",
+    "get_redis"
 ]
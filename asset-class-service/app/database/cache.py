@@ -0,0 +1,65 @@
+"""
+Redis connection setup for caching asset class reads.
+"""
+
+import logging
+from typing import Optional
+
+import redis.asyncio as redis
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class Cache:
+    """
+    Cache connection manager.
+    """
+    client: Optional[redis.Redis] = None
+
+
+cache = Cache()
+
+
+async def connect_to_redis():
+    """
+    Create the Redis client. Caching stays disabled if Redis is unavailable.
+    """
+    if not settings.redis_url:
+        logger.info("No Redis URL configured, asset class caching disabled")
+        return
+
+    try:
+        logger.info("Connecting to Redis at %s", settings.redis_url)
+
+        cache.client = redis.from_url(settings.redis_url)
+
+        await cache.client.ping()
+
+        logger.info("Successfully connected to Redis")
+
+    except redis.RedisError as e:
+        logger.error(
+            "Failed to connect to Redis, asset class caching disabled: %s", e)
+        cache.client = None
+
+
+async def close_redis_connection():
+    """
+    Close the Redis client.
+    """
+    try:
+        if cache.client:
+            await cache.client.aclose()
+
+            logger.info("Disconnected from Redis")
+    except redis.RedisError as e:
+        logger.error("Error closing Redis connection: %s", e)
+
+
+def get_redis() -> Optional[redis.Redis]:
+    """
+    Get the Redis client, or None when caching is disabled.
+    """
+    return cache.client
@@ -5,7 +5,7 @@ Database connection setup for MongoDB using Motor (async driver).
 
 import logging
 from typing import Optional
-from pymongo import AsyncMongoClient
+from pymongo import ASCENDING, DESCENDING, AsyncMongoClient
 from pymongo.asynchronous.database import AsyncDatabase
 from pymongo.asynchronous.collection import AsyncCollection
 from pymongo.errors import PyMongoError
@@ -33,12 +33,23 @@ async def connect_to_mongodb():
     try:
         logger.info("Connecting to mongoDB at %s", settings.mongodb_url)
 
-        db.client = AsyncMongoClient(settings.mongodb_url)
+        db.client = AsyncMongoClient(
+            settings.mongodb_url,
+            maxPoolSize=settings.mongodb_max_pool_size,
+            minPoolSize=settings.mongodb_min_pool_size,
+            maxIdleTimeMS=settings.mongodb_max_idle_time_ms,
+            serverSelectionTimeoutMS=settings.mongodb_server_selection_timeout_ms,
+            waitQueueTimeoutMS=settings.mongodb_wait_queue_timeout_ms
+        )
 
         db.database = db.client[settings.database_name]
 
+        # The driver fills the pool up to minPoolSize in the background once
+        # the first connection is established.
         await db.client.admin.command('ping')
 
+        await create_indexes()
+
         logger.info("Successfully connected to MongoDB database: %s",
                     settings.database_name)
 
@@ -47,6 +58,21 @@ async def connect_to_mongodb():
         raise
 
 
+async def create_indexes():
+    """
+    Create the indexes the repository queries rely on.
+    """
+    if db.database is None:
+        raise RuntimeError(
+            "Database not connected. Call connect_to_mongodb() first.")
+
+    collection = db.database[settings.collection_name]
+
+    await collection.create_index([("id", ASCENDING)], unique=True)
+    await collection.create_index([("name", ASCENDING)], unique=True)
+    await collection.create_index([("created_at", DESCENDING)])
+
+
 async def close_mongodb_connection():
     """
     Close database connection.
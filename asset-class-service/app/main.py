@@ -1,7 +1,10 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 from app.config import settings
-from app.database import connect_to_mongodb, close_mongodb_connection
+from app.database import (close_mongodb_connection, close_redis_connection,
+                          connect_to_mongodb, connect_to_redis, get_collection)
+from app.repositories.asset_class_repository import asset_class_repository
 from app.routers import asset_classes_router
 
 
@@ -11,16 +14,21 @@ async def lifespan(_: FastAPI):
     Lifespan context manager for FastAPI.
     """
     await connect_to_mongodb()
+    asset_class_repository.bind_collection(
+        get_collection(settings.collection_name))
+    await connect_to_redis()
 
     yield
 
+    await close_redis_connection()
     await close_mongodb_connection()
 
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     description="A service for managing asset classes in the investment paltform",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 app.include_router(asset_classes_router, prefix='/api')
@@ -57,5 +65,7 @@ if __name__ == "__main__":
         "app.main:app",
         host=settings.host,
         port=settings.port,
-        reload=settings.debug
+        reload=settings.debug,
+        workers=1 if settings.debug else settings.workers,
+        loop="asyncio" if settings.debug else "uvloop"
     )
@@ -1,16 +1,15 @@
-from enum import Enum
-from pydantic import BaseModel, ConfigDict, Field
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from typing import List, Literal, Optional
 from datetime import datetime, timezone
 import uuid
 
+import msgspec
+
 from pymongo import ASCENDING
 
 
-class AssetClassStatus(str, Enum):
-    """Valid asset class status values."""
-    ACTIVE = "active"
-    INACTIVE = "inactive"
+# Valid asset class status values.
+AssetClassStatus = Literal["active", "inactive"]
 
 
 class AssetClassBase(BaseModel):
@@ -21,8 +20,8 @@ class AssetClassBase(BaseModel):
                       description="Asset class name")
     description: Optional[str] = Field(
         None, max_length=500, description="Asset class description")
-    status: str = Field(
-        default=AssetClassStatus.ACTIVE, description="Asset class status")
+    status: AssetClassStatus = Field(
+        default="active", description="Asset class status")
 
 
 class AssetClassCreate(AssetClassBase):
@@ -45,8 +44,8 @@ class AssetClassInDB(AssetClassBase):
     """
     Model representing how asset class is stored in the database.
     """
-    id: str = Field(default_factory=lambda: str(
-        uuid.uuid4()), description="Unique identifier")
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex,
+                    description="Unique identifier")
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc),
                                  description="Creation timestamp")
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc),
@@ -54,10 +53,8 @@ class AssetClassInDB(AssetClassBase):
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
-        json_encoders={
-            datetime: lambda v: v.isoformat(),
-            AssetClassStatus: lambda v: v.value
-        }
+        validate_assignment=False,
+        revalidate_instances="never"
     )
 
 
@@ -68,18 +65,17 @@ class AssetClassResponse(BaseModel):
     id: str
     name: str
     description: Optional[str]
-    status: str
+    status: AssetClassStatus
     created_at: datetime
     updated_at: datetime
 
     model_config = ConfigDict(
-        json_encoders={
-            datetime: lambda v: v.isoformat(),
-            AssetClassStatus: lambda v: v.value
-        },
+        arbitrary_types_allowed=True,
+        validate_assignment=False,
+        revalidate_instances="never",
         json_schema_extra={
             "example": {
-                "id": "123e4567-e89b-12d3-a456-426614174000",
+                "id": "123e4567e89b12d3a456426614174000",
                 "name": "Private Equity",
                 "description": "Private equity investments including buyouts and growth capital",
                 "status": "active",
@@ -104,7 +100,7 @@ class AssetClassListResponse(BaseModel):
             "example": {
                 "data": [
                     {
-                        "id": "123e4567-e89b-12d3-a456-426614174000",
+                        "id": "123e4567e89b12d3a456426614174000",
                         "name": "Private Equity",
                         "description": "Private equity investments",
                         "status": "active",
@@ -114,8 +110,7 @@ class AssetClassListResponse(BaseModel):
                 ],
                 "total": 25,
                 "page": 1,
-                "size": 10,
-                "total_pages": 3
+                "size": 10
             }
         }
     )
@@ -133,7 +128,7 @@ class AssetClassCreateResponse(BaseModel):
             "example": {
                 "message": "Asset class created successfully",
                 "data": {
-                    "id": "123e4567-e89b-12d3-a456-426614174000",
+                    "id": "123e4567e89b12d3a456426614174000",
                     "name": "Private Equity",
                     "description": "Private equity investments",
                     "status": "active",
@@ -145,16 +140,76 @@ class AssetClassCreateResponse(BaseModel):
     )
 
 
+ASSET_CLASS_LIST_ADAPTER = TypeAdapter(List[AssetClassResponse])
+
+
+class AssetClassResponseStruct(msgspec.Struct):
+    """
+    msgspec mirror of AssetClassResponse used to encode list and bulk responses.
+    """
+    id: str
+    name: str
+    description: Optional[str]
+    status: str
+    created_at: datetime
+    updated_at: datetime
+
+
+class AssetClassListResponseStruct(msgspec.Struct):
+    """
+    msgspec mirror of AssetClassListResponse.
+    """
+    data: List[AssetClassResponseStruct]
+    total: int
+    page: int
+    size: int
+
+
+_ENCODER = msgspec.json.Encoder()
+
+
+def _to_struct(asset_class: AssetClassResponse) -> AssetClassResponseStruct:
+    return AssetClassResponseStruct(**asset_class.__dict__)
+
+
+def encode_asset_class(asset_class: AssetClassResponse) -> bytes:
+    """
+    Encode a single asset class as a JSON object.
+    """
+    return _ENCODER.encode(_to_struct(asset_class))
+
+
+def encode_asset_classes(asset_classes: List[AssetClassResponse]) -> bytes:
+    """
+    Encode asset classes as a JSON array.
+    """
+    return _ENCODER.encode([_to_struct(ac) for ac in asset_classes])
+
+
+def encode_asset_class_list(asset_classes: List[AssetClassResponse], total: int,
+                            page: int, size: int) -> bytes:
+    """
+    Encode a paginated asset class list response.
+    """
+    return _ENCODER.encode(AssetClassListResponseStruct(
+        data=[_to_struct(ac) for ac in asset_classes],
+        total=total,
+        page=page,
+        size=size
+    ))
+
+
 def convert_asset_class_from_db(doc: dict) -> Optional[AssetClassResponse]:
     """
     Convert a MongoDB document to an AssetClassResponse model.
+
+    Documents are written by this service, so field validation is skipped.
+    Reads project out the Mongo _id, so the document maps onto the fields.
     """
     if doc is None:
         return None
 
-    doc.pop("_id", None)
-
-    return AssetClassResponse(**doc)
+    return AssetClassResponse.model_construct(**doc)
 
 
 def prepare_asset_class_for_db(asset_class: AssetClassCreate) -> dict:
@@ -163,10 +218,11 @@ def prepare_asset_class_for_db(asset_class: AssetClassCreate) -> dict:
     """
     asset_class_dict = asset_class.model_dump()
 
+    now = datetime.now(timezone.utc)
     asset_class_dict.update({
-        "id": str(uuid.uuid4()),
-        "created_at": datetime.now(timezone.utc),
-        "updated_at": datetime.now(timezone.utc)
+        "id": uuid.uuid4().hex,
+        "created_at": now,
+        "updated_at": now
     })
 
     return asset_class_dict
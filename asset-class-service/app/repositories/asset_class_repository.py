@@ -3,15 +3,17 @@ Enhanced Asset Class Repository with bulk operations.
 """
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 from uuid import uuid4
 
 from pymongo.asynchronous.collection import AsyncCollection
-from pymongo.errors import DuplicateKeyError, PyMongoError
+from pymongo.errors import BulkWriteError, PyMongoError
+from redis.exceptions import RedisError
 
 from app.config import settings
-from app.database import get_collection
-from app.models.asset_class import (AssetClassCreate, AssetClassResponse,
+from app.database import get_redis
+from app.models.asset_class import (ASSET_CLASS_LIST_ADAPTER, AssetClassCreate,
+                                    AssetClassResponse,
                                     convert_asset_class_from_db,
                                     prepare_asset_class_for_db)
 
@@ -19,6 +21,21 @@ logger = logging.getLogger(__name__)
 
 MongoDocument = Dict[str, Any]
 
+ASSET_CLASS_PROJECTION = {
+    "_id": 0,
+    "id": 1,
+    "name": 1,
+    "description": 1,
+    "status": 1,
+    "created_at": 1,
+    "updated_at": 1
+}
+
+LIST_CACHE_KEY = "ac:list"
+ID_CACHE_KEY_PREFIX = "ac:id:"
+
+STREAM_BATCH_SIZE = 500
+
 
 class AssetClassRepository:
     """
@@ -28,14 +45,11 @@ class AssetClassRepository:
     def __init__(self) -> None:
         self._collection: Optional[AsyncCollection] = None
 
-    @property
-    def collection(self) -> AsyncCollection:
+    def bind_collection(self, collection: AsyncCollection) -> None:
         """
-        Lazy initialization of collection.
+        Bind the MongoDB collection once the connection is established.
         """
-        if self._collection is None:
-            self._collection = get_collection(settings.collection_name)
-        return self._collection
+        self._collection = collection
 
     async def get_by_ids(self, asset_class_ids: List[str]) -> List[AssetClassResponse]:
         """
@@ -45,23 +59,33 @@ class AssetClassRepository:
             return []
 
         try:
-            logger.debug(
-                "Bulk fetching %d asset classes from database", len(asset_class_ids))
-
-            cursor = self.collection.find({"id": {"$in": asset_class_ids}})
-            docs: List[MongoDocument] = await cursor.to_list(length=len(asset_class_ids))
-
-            asset_classes = [
-                converted for doc in docs
-                if (converted := convert_asset_class_from_db(doc)) is not None
-            ]
+            asset_classes = await self._get_cached_by_ids(asset_class_ids)
+            cached_ids = {ac.id for ac in asset_classes}
+            uncached_ids = [
+                ac_id for ac_id in asset_class_ids if ac_id not in cached_ids]
+
+            if uncached_ids:
+                logger.debug(
+                    "Bulk fetching %d asset classes from database", len(uncached_ids))
+
+                cursor = self._collection.find(
+                    {"id": {"$in": uncached_ids}}, projection=ASSET_CLASS_PROJECTION)
+                docs: List[MongoDocument] = await cursor.to_list(length=len(uncached_ids))
+
+                fetched = [
+                    converted for doc in docs
+                    if (converted := convert_asset_class_from_db(doc)) is not None
+                ]
+                await self._cache_by_ids(fetched)
+                asset_classes.extend(fetched)
 
             logger.debug("Successfully fetched %d/%d asset classes from database",
                          len(asset_classes), len(asset_class_ids))
 
-            if len(asset_classes) < len(asset_class_ids):
-                found_ids = {ac.id for ac in asset_classes}
-                missing_ids = set(asset_class_ids) - found_ids
+            if (len(asset_classes) < len(asset_class_ids)
+                    and logger.isEnabledFor(logging.WARNING)):
+                missing_ids = set(asset_class_ids).difference(
+                    ac.id for ac in asset_classes)
                 logger.warning("Asset classes not found: %s",
                                list(missing_ids))
 
@@ -77,40 +101,70 @@ class AssetClassRepository:
         """
         asset_class_dict = prepare_asset_class_for_db(asset_class)
 
-        result = await self.collection.insert_one(asset_class_dict)
-
-        created_doc: Optional[MongoDocument] = await self.collection.find_one({
-            "_id": result.inserted_id
-        })
-
-        if created_doc is None:
-            raise RuntimeError("Failed to retrieve created document")
+        await self._collection.insert_one(asset_class_dict)
+        await self._invalidate_list_cache()
 
-        created_doc.pop("_id", None)
+        # insert_one injects the generated _id into the inserted dict.
+        asset_class_dict.pop("_id", None)
 
-        return convert_asset_class_from_db(created_doc)
+        return AssetClassResponse.model_construct(**asset_class_dict)
 
-    async def get_all(self) -> List[AssetClassResponse]:
+    async def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        status: Optional[str] = None
+    ) -> List[AssetClassResponse]:
         """
-        Get all asset classes.
+        Get a page of asset classes, newest first, optionally filtered by status.
         """
-        cursor = self.collection.find().sort("created_at", -1)
+        cache_field = f"{status or '*'}:{skip}:{limit}"
+        cached = await self._get_cached_list(cache_field)
+        if cached is not None:
+            return cached
 
-        docs: List[MongoDocument] = await cursor.to_list(length=None)
+        query = {}
+        if status:
+            query["status"] = status
 
-        return [
+        cursor = self._collection.find(
+            query, projection=ASSET_CLASS_PROJECTION
+        ).sort("created_at", -1).skip(skip).limit(limit)
+
+        docs: List[MongoDocument] = await cursor.to_list(length=limit)
+
+        asset_classes = [
             converted for doc in docs if (converted := convert_asset_class_from_db(doc)) is not None
         ]
+        await self._cache_list(cache_field, asset_classes)
+
+        return asset_classes
 
     async def get_by_name(self, name: str) -> Optional[AssetClassResponse]:
         """
         Get an asset class by name (useful for checking duplicates).
         """
-        doc: Optional[MongoDocument] = await self.collection.find_one({"name": name})
+        doc: Optional[MongoDocument] = await self._collection.find_one(
+            {"name": name}, projection=ASSET_CLASS_PROJECTION)
         if doc:
             return convert_asset_class_from_db(doc)
         return None
 
+    async def stream_all(self, status: Optional[str] = None) -> AsyncIterator[AssetClassResponse]:
+        """
+        Stream all asset classes, newest first, without loading them into one list.
+        """
+        query = {}
+        if status:
+            query["status"] = status
+
+        cursor = self._collection.find(
+            query, projection=ASSET_CLASS_PROJECTION
+        ).sort("created_at", -1).batch_size(STREAM_BATCH_SIZE)
+
+        async for doc in cursor:
+            yield convert_asset_class_from_db(doc)
+
     async def count(self, status: Optional[str] = None) -> int:
         """
         Count total asset classes, optionally filtered by status.
@@ -119,7 +173,7 @@ class AssetClassRepository:
         if status:
             query["status"] = status
 
-        return await self.collection.count_documents(query)
+        return await self._collection.count_documents(query)
 
     async def bulk_create(self, asset_classes: List[AssetClassCreate]) -> List[AssetClassResponse]:
         """
@@ -131,35 +185,44 @@ class AssetClassRepository:
         try:
             logger.info("Bulk creating %d asset classes", len(asset_classes))
 
+            now = datetime.now(timezone.utc)
             asset_class_docs = []
             for ac in asset_classes:
                 doc = ac.model_dump()
                 doc.update({
-                    "id": str(uuid4()),
-                    "created_at": datetime.now(timezone.utc),
-                    "updated_at": datetime.now(timezone.utc)
+                    "id": uuid4().hex,
+                    "created_at": now,
+                    "updated_at": now
                 })
                 asset_class_docs.append(doc)
 
-            result = await self.collection.insert_many(asset_class_docs)
+            try:
+                await self._collection.insert_many(asset_class_docs, ordered=False)
+                inserted_docs = asset_class_docs
+            except BulkWriteError as e:
+                write_errors = e.details.get("writeErrors", [])
+                for error in write_errors:
+                    logger.warning("Failed to create asset class '%s': %s",
+                                   asset_class_docs[error["index"]]["name"],
+                                   error.get("errmsg"))
+
+                failed_indexes = {error["index"] for error in write_errors}
+                inserted_docs = [
+                    doc for i, doc in enumerate(asset_class_docs) if i not in failed_indexes
+                ]
 
-            created_docs = await self.collection.find({
-                "_id": {"$in": result.inserted_ids}
-            }).to_list(length=len(asset_classes))
+            await self._invalidate_list_cache()
 
             created_asset_classes = []
-            for doc in created_docs:
+            for doc in inserted_docs:
                 doc.pop("_id", None)
-                created_asset_classes.append(AssetClassResponse(**doc))
+                created_asset_classes.append(
+                    AssetClassResponse.model_construct(**doc))
 
             logger.info("Successfully bulk created %d asset classes",
                         len(created_asset_classes))
             return created_asset_classes
 
-        except DuplicateKeyError as e:
-            logger.error(
-                "Duplicate key error in bulk asset class creation: %s", e)
-            return []
         except PyMongoError as e:
             logger.error("Database error bulk creating asset classes: %s", e)
             return []
@@ -167,5 +230,90 @@ class AssetClassRepository:
             logger.error("Unexpected error bulk creating asset classes: %s", e)
             return []
 
+    async def _get_cached_list(self, field: str) -> Optional[List[AssetClassResponse]]:
+        """
+        Read a cached page of asset classes.
+        """
+        redis_client = get_redis()
+        if redis_client is None:
+            return None
+
+        try:
+            raw = await redis_client.hget(LIST_CACHE_KEY, field)
+        except RedisError as e:
+            logger.warning("Error reading asset class list cache: %s", e)
+            return None
+
+        return ASSET_CLASS_LIST_ADAPTER.validate_json(raw) if raw else None
+
+    async def _cache_list(self, field: str, asset_classes: List[AssetClassResponse]) -> None:
+        """
+        Cache a page of asset classes. Pages share one hash so writes can drop them together.
+
+        The TTL is only set when the hash is created (EXPIRE NX, Redis 7+), so
+        later pages never extend the life of pages cached before them.
+        """
+        redis_client = get_redis()
+        if redis_client is None:
+            return
+
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.hset(LIST_CACHE_KEY, field,
+                          ASSET_CLASS_LIST_ADAPTER.dump_json(asset_classes))
+                pipe.expire(LIST_CACHE_KEY, settings.cache_ttl_seconds, nx=True)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning("Error writing asset class list cache: %s", e)
+
+    async def _invalidate_list_cache(self) -> None:
+        """
+        Drop every cached page after a write.
+        """
+        redis_client = get_redis()
+        if redis_client is None:
+            return
+
+        try:
+            await redis_client.delete(LIST_CACHE_KEY)
+        except RedisError as e:
+            logger.warning("Error invalidating asset class list cache: %s", e)
+
+    async def _get_cached_by_ids(self, asset_class_ids: List[str]) -> List[AssetClassResponse]:
+        """
+        Read the cached asset classes among the given IDs.
+        """
+        redis_client = get_redis()
+        if redis_client is None:
+            return []
+
+        try:
+            raw_values = await redis_client.mget(
+                [f"{ID_CACHE_KEY_PREFIX}{ac_id}" for ac_id in asset_class_ids])
+        except RedisError as e:
+            logger.warning("Error reading asset class cache: %s", e)
+            return []
+
+        return [
+            AssetClassResponse.model_validate_json(raw) for raw in raw_values if raw
+        ]
+
+    async def _cache_by_ids(self, asset_classes: List[AssetClassResponse]) -> None:
+        """
+        Cache asset classes individually by ID.
+        """
+        redis_client = get_redis()
+        if redis_client is None or not asset_classes:
+            return
+
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for ac in asset_classes:
+                    pipe.set(f"{ID_CACHE_KEY_PREFIX}{ac.id}", ac.model_dump_json(),
+                             ex=settings.cache_ttl_seconds)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning("Error writing asset class cache: %s", e)
+
 
 asset_class_repository = AssetClassRepository()
@@ -1,13 +1,19 @@
 """
 Enhanced Asset Class router with bulk fetch endpoint.
 """
+import asyncio
 import logging
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
-from fastapi import APIRouter, Body, HTTPException, Query, status
+from fastapi import APIRouter, Body, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from pymongo.errors import DuplicateKeyError
 
 from app.models.asset_class import (AssetClassCreate, AssetClassCreateResponse,
-                                    AssetClassListResponse, AssetClassResponse)
+                                    AssetClassListResponse, AssetClassResponse,
+                                    AssetClassStatus, encode_asset_class,
+                                    encode_asset_class_list,
+                                    encode_asset_classes)
 from app.repositories.asset_class_repository import asset_class_repository
 
 logger = logging.getLogger(__name__)
@@ -53,7 +59,10 @@ async def bulk_get_asset_classes(
         logger.info("Successfully fetched %d/%d asset classes",
                     len(asset_classes), len(asset_class_ids))
 
-        return [AssetClassResponse(**ac.model_dump()) for ac in asset_classes]
+        return Response(
+            content=encode_asset_classes(asset_classes),
+            media_type="application/json"
+        )
 
     except HTTPException:
         raise
@@ -77,13 +86,6 @@ async def create_asset_class(asset_class: AssetClassCreate):
     Create a new asset class.
     """
     try:
-        existing = await asset_class_repository.get_by_name(asset_class.name)
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"Asset class with name '{asset_class.name}' already exists"
-            )
-
         created_asset_class = await asset_class_repository.create(asset_class)
 
         if not created_asset_class:
@@ -93,10 +95,12 @@ async def create_asset_class(asset_class: AssetClassCreate):
                 detail="Failed to create investor"
             )
 
-        response_data = AssetClassResponse(
-            **created_asset_class.model_dump())
-
-        return AssetClassCreateResponse(data=response_data)
+        return AssetClassCreateResponse(data=created_asset_class)
+    except DuplicateKeyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Asset class with name '{asset_class.name}' already exists"
+        ) from e
     except HTTPException:
         raise
     except Exception as e:
@@ -109,22 +113,40 @@ async def create_asset_class(asset_class: AssetClassCreate):
 
 @router.get(
     "/",
-    response_model=List[AssetClassResponse],
+    response_model=AssetClassListResponse,
     summary="List all asset classes",
     description="Get a paginated list of asset classes with optional filtering."
 )
-async def list_asset_classes():
+async def list_asset_classes(
+    skip: int = Query(0, ge=0,
+                      description="Number of asset classes to skip; use a multiple of limit"),
+    limit: int = Query(100, ge=1, le=1000,
+                       description="Maximum number of asset classes to return"),
+    asset_status: Optional[AssetClassStatus] = Query(
+        None, alias="status", description="Filter by status")
+):
     """
     Get a list of asset classes with pagination and filtering.
+
+    The reported page is skip // limit + 1, so callers should page in whole
+    multiples of limit; any other skip reports the page it starts in.
     """
     try:
-        asset_classes = await asset_class_repository.get_all()
-
-        response_data = [
-            AssetClassResponse(**asset_class.model_dump()) for asset_class in asset_classes
-        ]
-
-        return response_data
+        asset_classes, total = await asyncio.gather(
+            asset_class_repository.get_all(
+                skip=skip, limit=limit, status=asset_status),
+            asset_class_repository.count(status=asset_status)
+        )
+
+        return Response(
+            content=encode_asset_class_list(
+                asset_classes,
+                total=total,
+                page=(skip // limit) + 1,
+                size=limit
+            ),
+            media_type="application/json"
+        )
 
     except Exception as e:
         logger.error("Error listing asset classes: %s", e)
@@ -134,6 +156,37 @@ async def list_asset_classes():
         ) from e
 
 
+@router.get(
+    "/stream",
+    response_model=List[AssetClassResponse],
+    summary="Stream all asset classes",
+    description="Stream every asset class as a JSON array without paginating."
+)
+async def stream_asset_classes(
+    asset_status: Optional[AssetClassStatus] = Query(
+        None, alias="status", description="Filter by status")
+):
+    """
+    Stream all asset classes, encoding each as it is read from the cursor.
+    """
+    async def generate() -> AsyncIterator[bytes]:
+        yield b"["
+        first = True
+        try:
+            async for asset_class in asset_class_repository.stream_all(status=asset_status):
+                if not first:
+                    yield b","
+                yield encode_asset_class(asset_class)
+                first = False
+        except Exception as e:
+            # Headers are already sent; abort so the client sees a truncated body.
+            logger.error("Error streaming asset classes: %s", e)
+            raise
+        yield b"]"
+
+    return StreamingResponse(generate(), media_type="application/json")
+
+
 @router.post(
     "/bulk-create",
     response_model=List[AssetClassResponse],
@@ -143,7 +196,7 @@ async def list_asset_classes():
 async def bulk_create_asset_classes(
     asset_classes_data: List[AssetClassCreate] = Body(...,
                                                       description="List of asset classes to create")
-) -> List[AssetClassResponse]:
+):
     """
     Bulk create asset classes for efficient ingestion.
     """
@@ -164,7 +217,10 @@ async def bulk_create_asset_classes(
         logger.info("Successfully bulk created %d/%d asset classes",
                     len(created_asset_classes), len(asset_classes_data))
 
-        return [AssetClassResponse(**ac.model_dump()) for ac in created_asset_classes]
+        return Response(
+            content=encode_asset_classes(created_asset_classes),
+            media_type="application/json"
+        )
 
     except HTTPException:
         raise
@@ -3,8 +3,41 @@ from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.asynchronous.cursor import AsyncCursor
 
 from app.models.asset_class import AssetClassCreate, AssetClassResponse
+from app.repositories.asset_class_repository import AssetClassRepository
+
+
+FROZEN_NOW = datetime.now(timezone.utc)
+
+SAMPLE_MONGO_DOCS = (
+    {
+        "_id": "mongo_id_1",
+        "id": "test-id-1",
+        "name": "Private Equity",
+        "description": "PE investments",
+        "status": "active",
+        "created_at": FROZEN_NOW,
+        "updated_at": FROZEN_NOW
+    },
+    {
+        "_id": "mongo_id_2",
+        "id": "test-id-2",
+        "name": "Real Estate",
+        "description": "RE investments",
+        "status": "active",
+        "created_at": FROZEN_NOW,
+        "updated_at": FROZEN_NOW
+    }
+)
+
+
+def pytest_configure(config):
+    """Register the markers used by the test suite."""
+    config.addinivalue_line(
+        "markers", "unit: fast tests that mock MongoDB, Redis and the repository")
 
 
 @pytest.fixture(scope="session")
@@ -15,6 +48,12 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(scope="session")
+def frozen_now():
+    """Single timestamp shared by every test in the session."""
+    return FROZEN_NOW
+
+
 @pytest.fixture
 def sample_asset_class_create():
     """Sample AssetClassCreate model for testing."""
@@ -33,8 +72,8 @@ def sample_asset_class_response():
         name="Test Private Equity",
         description="Test private equity investments",
         status="active",
-        created_at=datetime.now(timezone.utc),
-        updated_at=datetime.now(timezone.utc)
+        created_at=FROZEN_NOW,
+        updated_at=FROZEN_NOW
     )
 
 
@@ -54,10 +93,15 @@ def sample_asset_classes_list():
 @pytest.fixture
 def mock_mongo_collection():
     """Properly mocked MongoDB AsyncCollection for use with pymongo[asyncio]."""
-    mock_collection = MagicMock()
+    mock_collection = MagicMock(spec=AsyncCollection)
 
-    mock_cursor = MagicMock()
+    # Only the awaited cursor method is an AsyncMock; the chained builders return the cursor.
+    mock_cursor = MagicMock(spec=AsyncCursor)
     mock_cursor.to_list = AsyncMock()
+    mock_cursor.sort.return_value = mock_cursor
+    mock_cursor.skip.return_value = mock_cursor
+    mock_cursor.limit.return_value = mock_cursor
+    mock_cursor.batch_size.return_value = mock_cursor
     mock_collection.find.return_value = mock_cursor
 
     mock_collection.insert_one = AsyncMock()
@@ -71,32 +115,27 @@ def mock_mongo_collection():
 @pytest.fixture
 def asset_class_repository(mock_mongo_collection):
     """Repository with mocked MongoDB collection."""
-    from app.repositories.asset_class_repository import AssetClassRepository
     repo = AssetClassRepository()
-    repo._collection = mock_mongo_collection
+    repo.bind_collection(mock_mongo_collection)
     return repo
 
 
+@pytest.fixture
+def mock_repository():
+    """Mock asset class repository restricted to the real repository interface."""
+    return AsyncMock(spec=AssetClassRepository)
+
+
 @pytest.fixture
 def sample_mongo_docs():
-    """Sample MongoDB documents for testing."""
+    """Sample MongoDB documents for testing, copied so tests can mutate them."""
+    return [dict(doc) for doc in SAMPLE_MONGO_DOCS]
+
+
+@pytest.fixture(scope="module")
+def sample_asset_class_responses():
+    """Responses for the sample documents, built once per module."""
     return [
-        {
-            "_id": "mongo_id_1",
-            "id": "test-id-1",
-            "name": "Private Equity",
-            "description": "PE investments",
-            "status": "active",
-            "created_at": datetime.now(timezone.utc),
-            "updated_at": datetime.now(timezone.utc)
-        },
-        {
-            "_id": "mongo_id_2",
-            "id": "test-id-2",
-            "name": "Real Estate",
-            "description": "RE investments",
-            "status": "active",
-            "created_at": datetime.now(timezone.utc),
-            "updated_at": datetime.now(timezone.utc)
-        }
+        AssetClassResponse(**{k: v for k, v in doc.items() if k != "_id"})
+        for doc in SAMPLE_MONGO_DOCS
     ]
@@ -0,0 +1,55 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from app.models.asset_class import (ASSET_CLASS_LIST_ADAPTER, AssetClassCreate,
+                                    AssetClassResponse,
+                                    convert_asset_class_from_db,
+                                    encode_asset_classes)
+
+pytestmark = pytest.mark.unit
+
+
+class TestAssetClassModels:
+    """Test cases for asset class model helpers."""
+
+    def test_convert_asset_class_from_db_preserves_field_types(self):
+        """Test DB documents are converted without altering field types."""
+        created_at = datetime(2024, 7, 26, 10, 30, tzinfo=timezone.utc)
+        doc = {
+            "id": "test-id-1",
+            "name": "Private Equity",
+            "description": None,
+            "status": "active",
+            "created_at": created_at,
+            "updated_at": created_at
+        }
+
+        result = convert_asset_class_from_db(doc)
+
+        assert isinstance(result, AssetClassResponse)
+        assert result.id == "test-id-1"
+        assert result.name == "Private Equity"
+        assert result.description is None
+        assert result.status == "active"
+        assert isinstance(result.created_at, datetime)
+        assert result.created_at == created_at
+        assert result.updated_at == created_at
+
+    def test_convert_asset_class_from_db_none(self):
+        """Test None documents are passed through."""
+        assert convert_asset_class_from_db(None) is None
+
+    def test_asset_class_create_rejects_unknown_status(self):
+        """Test status is restricted to the known values."""
+        with pytest.raises(ValidationError):
+            AssetClassCreate(name="Private Equity", status="archived")
+
+    def test_encode_asset_classes_matches_pydantic(self, sample_asset_class_response):
+        """Test the msgspec encoder produces the same payload as the pydantic models."""
+        asset_classes = [sample_asset_class_response]
+
+        assert json.loads(encode_asset_classes(asset_classes)) == json.loads(
+            ASSET_CLASS_LIST_ADAPTER.dump_json(asset_classes))
@@ -1,17 +1,35 @@
-from datetime import datetime, timezone
+import importlib
+from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from pymongo.errors import DuplicateKeyError, PyMongoError
+from pymongo.errors import BulkWriteError, DuplicateKeyError, PyMongoError
 
-from app.models.asset_class import AssetClassResponse
+from app.config import settings
+from app.models.asset_class import ASSET_CLASS_LIST_ADAPTER, AssetClassResponse
+from app.repositories.asset_class_repository import (ASSET_CLASS_PROJECTION,
+                                                     LIST_CACHE_KEY)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def patched_prepare(monkeypatch):
+    """Replace prepare_asset_class_for_db on the repository module."""
+    # app.repositories rebinds asset_class_repository to its shared instance.
+    repository_module = importlib.import_module(
+        "app.repositories.asset_class_repository")
+    mock_prepare = MagicMock(return_value={"test": "doc"})
+    monkeypatch.setattr(
+        repository_module, "prepare_asset_class_for_db", mock_prepare)
+    return mock_prepare
 
 
 class TestAssetClassRepository:
     """Test cases for AssetClassRepository."""
 
     @pytest.mark.asyncio
-    async def test_create_asset_class_success(self, asset_class_repository, sample_asset_class_create, mock_mongo_collection):
+    async def test_create_asset_class_success(self, asset_class_repository, sample_asset_class_create, mock_mongo_collection, frozen_now, patched_prepare):
         """Test successful asset class creation."""
 
         inserted_id = "mock_inserted_id"
@@ -21,63 +39,41 @@ class TestAssetClassRepository:
             "name": sample_asset_class_create.name,
             "description": sample_asset_class_create.description,
             "status": sample_asset_class_create.status,
-            "created_at": datetime.now(timezone.utc),
-            "updated_at": datetime.now(timezone.utc)
+            "created_at": frozen_now,
+            "updated_at": frozen_now
         }
 
         mock_mongo_collection.insert_one.return_value = MagicMock(
             inserted_id=inserted_id)
-        mock_mongo_collection.find_one.return_value = created_doc
-
-        # Mock the prepare function
-        with patch('app.repositories.asset_class_repository.prepare_asset_class_for_db') as mock_prepare:
-            mock_prepare.return_value = created_doc
-
-            result = await asset_class_repository.create(sample_asset_class_create)
-
-            assert result is not None
-            assert result.name == sample_asset_class_create.name
-            assert result.description == sample_asset_class_create.description
-            assert result.status == sample_asset_class_create.status
-            mock_mongo_collection.insert_one.assert_called_once()
-            mock_mongo_collection.find_one.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_create_asset_class_retrieve_failure(self, asset_class_repository, sample_asset_class_create, mock_mongo_collection):
-        """Test creation failure when document can't be retrieved."""
 
-        mock_mongo_collection.insert_one.return_value = MagicMock(
-            inserted_id="test_id")
-        mock_mongo_collection.find_one.return_value = None
+        patched_prepare.return_value = created_doc
 
-        with patch('app.repositories.asset_class_repository.prepare_asset_class_for_db') as mock_prepare:
-            mock_prepare.return_value = {"test": "doc"}
+        result = await asset_class_repository.create(sample_asset_class_create)
 
-            with pytest.raises(RuntimeError, match="Failed to retrieve created document"):
-                await asset_class_repository.create(sample_asset_class_create)
+        assert result is not None
+        assert result.id == "test-id-123"
+        assert result.name == sample_asset_class_create.name
+        assert result.description == sample_asset_class_create.description
+        assert result.status == sample_asset_class_create.status
+        patched_prepare.assert_called_once_with(sample_asset_class_create)
+        mock_mongo_collection.insert_one.assert_called_once_with(created_doc)
+        mock_mongo_collection.find_one.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_get_by_ids_success(self, asset_class_repository, mock_mongo_collection, sample_mongo_docs):
+    async def test_get_by_ids_success(self, asset_class_repository, mock_mongo_collection, sample_mongo_docs, sample_asset_class_responses):
         """Test successful bulk fetch by IDs."""
         asset_class_ids = ["test-id-1", "test-id-2"]
 
-        mock_cursor = MagicMock()
-        mock_cursor.to_list = AsyncMock(return_value=sample_mongo_docs)
-        mock_mongo_collection.find.return_value = mock_cursor
+        mock_mongo_collection.find.return_value.to_list.return_value = sample_mongo_docs
 
-        with patch('app.models.asset_class.convert_asset_class_from_db') as mock_convert:
-            mock_convert.side_effect = [
-                AssetClassResponse(**{k: v for k, v in doc.items() if k != "_id"}) for doc in sample_mongo_docs
-            ]
+        with patch('app.repositories.asset_class_repository.convert_asset_class_from_db') as mock_convert:
+            mock_convert.side_effect = sample_asset_class_responses
 
             result = await asset_class_repository.get_by_ids(asset_class_ids)
 
-            assert len(result) == 2
-            assert result[0].name == "Private Equity"
-            assert result[1].name == "Real Estate"
-            assert all(isinstance(r, AssetClassResponse) for r in result)
+            assert result == sample_asset_class_responses
             mock_mongo_collection.find.assert_called_once_with(
-                {"id": {"$in": asset_class_ids}})
+                {"id": {"$in": asset_class_ids}}, projection=ASSET_CLASS_PROJECTION)
 
     @pytest.mark.asyncio
     async def test_get_by_ids_database_error(self, asset_class_repository, mock_mongo_collection):
@@ -90,23 +86,20 @@ class TestAssetClassRepository:
         assert result == []
 
     @pytest.mark.asyncio
-    async def test_get_by_name_found(self, asset_class_repository, mock_mongo_collection, sample_mongo_docs):
+    async def test_get_by_name_found(self, asset_class_repository, mock_mongo_collection, sample_mongo_docs, sample_asset_class_responses):
         """Test finding asset class by name."""
 
         mock_mongo_collection.find_one.return_value = sample_mongo_docs[0]
 
         with patch('app.repositories.asset_class_repository.convert_asset_class_from_db') as mock_convert:
-            mock_convert.return_value = AssetClassResponse(
-                id="test-id-1", name="Private Equity", description="PE investments",
-                status="active", created_at=datetime.now(timezone.utc), updated_at=datetime.now(timezone.utc)
-            )
+            mock_convert.return_value = sample_asset_class_responses[0]
 
             result = await asset_class_repository.get_by_name("Private Equity")
 
             assert result is not None
             assert result.name == "Private Equity"
             mock_mongo_collection.find_one.assert_called_once_with(
-                {"name": "Private Equity"})
+                {"name": "Private Equity"}, projection=ASSET_CLASS_PROJECTION)
 
     @pytest.mark.asyncio
     async def test_get_by_name_not_found(self, asset_class_repository, mock_mongo_collection):
@@ -118,41 +111,70 @@ class TestAssetClassRepository:
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_get_all_with_pagination(self, asset_class_repository, mock_mongo_collection, sample_mongo_docs):
+    async def test_get_all_with_pagination(self, asset_class_repository, mock_mongo_collection, sample_mongo_docs, sample_asset_class_responses):
         """Test get_all with pagination parameters."""
-        mock_cursor = MagicMock()
-
-        mock_cursor.skip = MagicMock(return_value=mock_cursor)
-        mock_cursor.limit = MagicMock(return_value=mock_cursor)
-        mock_cursor.sort = MagicMock(return_value=mock_cursor)
-
-        async def mock_to_list(length=None):
-            return sample_mongo_docs
-
-        mock_cursor.to_list = mock_to_list
-        mock_mongo_collection.find.return_value = mock_cursor
+        mock_cursor = mock_mongo_collection.find.return_value
+        mock_cursor.to_list.return_value = sample_mongo_docs
 
         with patch('app.repositories.asset_class_repository.convert_asset_class_from_db') as mock_convert:
-            mock_convert.side_effect = [
-                AssetClassResponse(
-                    id="test-id-1", name="Private Equity", description="PE",
-                    status="active", created_at=datetime.now(timezone.utc), updated_at=datetime.now(timezone.utc)
-                ),
-                AssetClassResponse(
-                    id="test-id-2", name="Real Estate", description="RE",
-                    status="active", created_at=datetime.now(timezone.utc), updated_at=datetime.now(timezone.utc)
-                )
-            ]
+            mock_convert.side_effect = sample_asset_class_responses
 
             result = await asset_class_repository.get_all(skip=10, limit=5, status="active")
 
             assert len(result) == 2
             mock_mongo_collection.find.assert_called_once_with(
-                {"status": "active"})
+                {"status": "active"}, projection=ASSET_CLASS_PROJECTION)
             mock_cursor.skip.assert_called_once_with(10)
             mock_cursor.limit.assert_called_once_with(5)
             mock_cursor.sort.assert_called_once_with("created_at", -1)
 
+    @pytest.mark.asyncio
+    async def test_get_all_cache_hit(self, asset_class_repository, mock_mongo_collection, sample_asset_class_response):
+        """Test get_all serves a cached page without querying MongoDB."""
+        mock_redis = MagicMock()
+        mock_redis.hget = AsyncMock(
+            return_value=ASSET_CLASS_LIST_ADAPTER.dump_json([sample_asset_class_response]))
+
+        with patch('app.repositories.asset_class_repository.get_redis', return_value=mock_redis):
+            result = await asset_class_repository.get_all(skip=0, limit=5)
+
+        assert result == [sample_asset_class_response]
+        mock_redis.hget.assert_called_once_with(LIST_CACHE_KEY, "*:0:5")
+        mock_mongo_collection.find.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_all_cache_miss_keeps_list_ttl(self, asset_class_repository, mock_mongo_collection, sample_mongo_docs, sample_asset_class_responses):
+        """Test caching a page only sets the list TTL when the hash has none."""
+        mock_cursor = mock_mongo_collection.find.return_value
+        mock_cursor.to_list.return_value = sample_mongo_docs
+        mock_pipe = MagicMock()
+        mock_pipe.execute = AsyncMock()
+        mock_redis = MagicMock()
+        mock_redis.hget = AsyncMock(return_value=None)
+        mock_redis.pipeline.return_value.__aenter__ = AsyncMock(return_value=mock_pipe)
+        mock_redis.pipeline.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        with patch('app.repositories.asset_class_repository.get_redis', return_value=mock_redis), \
+                patch('app.repositories.asset_class_repository.convert_asset_class_from_db',
+                      side_effect=sample_asset_class_responses):
+            await asset_class_repository.get_all(skip=0, limit=5)
+
+        mock_pipe.hset.assert_called_once()
+        mock_pipe.expire.assert_called_once_with(
+            LIST_CACHE_KEY, settings.cache_ttl_seconds, nx=True)
+        mock_pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_create_invalidates_list_cache(self, asset_class_repository, sample_asset_class_create, mock_mongo_collection):
+        """Test creating an asset class drops the cached list pages."""
+        mock_redis = MagicMock()
+        mock_redis.delete = AsyncMock()
+
+        with patch('app.repositories.asset_class_repository.get_redis', return_value=mock_redis):
+            await asset_class_repository.create(sample_asset_class_create)
+
+        mock_redis.delete.assert_called_once_with(LIST_CACHE_KEY)
+
     @pytest.mark.asyncio
     async def test_count_total(self, asset_class_repository, mock_mongo_collection):
         """Test counting all asset classes."""
@@ -181,22 +203,10 @@ class TestAssetClassRepository:
         """Test successful bulk creation."""
 
         inserted_ids = ["id1", "id2", "id3"]
-        created_docs = [
-            {"_id": "id1", "id": "uuid1", "name": "Private Equity", "status": "active", "description": "PE investments",
-                "created_at": datetime.now(timezone.utc), "updated_at": datetime.now(timezone.utc)},
-            {"_id": "id2", "id": "uuid2", "name": "Real Estate", "status": "active", "description": "RE investments",
-                "created_at": datetime.now(timezone.utc), "updated_at": datetime.now(timezone.utc)},
-            {"_id": "id3", "id": "uuid3", "name": "Infrastructure", "status": "inactive", "description": "Infrastructure investments",
-                "created_at": datetime.now(timezone.utc), "updated_at": datetime.now(timezone.utc)}
-        ]
 
         mock_mongo_collection.insert_many.return_value = MagicMock(
             inserted_ids=inserted_ids)
 
-        mock_cursor = AsyncMock()
-        mock_cursor.to_list = AsyncMock(return_value=created_docs)
-        mock_mongo_collection.find.return_value = mock_cursor
-
         result = await asset_class_repository.bulk_create(sample_asset_classes_list)
 
         assert len(result) == 3
@@ -204,10 +214,9 @@ class TestAssetClassRepository:
         assert result[0].name == "Private Equity"
         assert result[1].name == "Real Estate"
         assert result[2].name == "Infrastructure"
+        assert all(isinstance(ac.created_at, datetime) for ac in result)
         mock_mongo_collection.insert_many.assert_called_once()
-        mock_mongo_collection.find.assert_called_once_with(
-            {"_id": {"$in": inserted_ids}}
-        )
+        mock_mongo_collection.find.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_bulk_create_empty_list(self, asset_class_repository):
@@ -228,6 +237,23 @@ class TestAssetClassRepository:
 
         assert result == []
 
+    @pytest.mark.asyncio
+    async def test_bulk_create_partial_failure(self, asset_class_repository, mock_mongo_collection, sample_asset_classes_list):
+        """Test bulk create keeps the documents that were inserted."""
+
+        mock_mongo_collection.insert_many.side_effect = BulkWriteError({
+            "writeErrors": [
+                {"index": 1, "code": 11000, "errmsg": "E11000 duplicate key error"}
+            ]
+        })
+
+        result = await asset_class_repository.bulk_create(sample_asset_classes_list)
+
+        assert [ac.name for ac in result] == [
+            "Private Equity", "Infrastructure"]
+        _, kwargs = mock_mongo_collection.insert_many.call_args
+        assert kwargs["ordered"] is False
+
     @pytest.mark.asyncio
     async def test_bulk_create_pymongo_error(self, asset_class_repository, mock_mongo_collection, sample_asset_classes_list):
         """Test bulk create with general PyMongo error."""
@@ -1,24 +1,41 @@
+import json
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, patch
+from types import SimpleNamespace
 
 import pytest
 from fastapi import HTTPException, status
 from fastapi.testclient import TestClient
+from pymongo.errors import DuplicateKeyError
 
-from app.main import app
 from app.models.asset_class import AssetClassCreate, AssetClassResponse
 
+pytestmark = pytest.mark.unit
 
-@pytest.fixture
-def client():
-    """Test client for FastAPI app."""
+
+@pytest.fixture(scope="session")
+def app():
+    """FastAPI app, imported on first use rather than at collection time."""
+    from app.main import app as _app
+    return _app
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """Test client for FastAPI app, built once per session.
+
+    Not entered as a context manager: the lifespan connects to MongoDB and
+    Redis, which unit tests replace with mocks.
+    """
     return TestClient(app)
 
 
-@pytest.fixture
-def mock_repository():
-    """Mock asset class repository."""
-    return AsyncMock()
+@pytest.fixture(autouse=True)
+def patched_repo(monkeypatch, mock_repository):
+    """Install the mock repository on the router module for every test."""
+    import app.routers.asset_classes as router_module
+    monkeypatch.setattr(
+        router_module, "asset_class_repository", mock_repository)
+    return mock_repository
 
 
 class TestAssetClassRouters:
@@ -30,36 +47,35 @@ class TestAssetClassRouters:
 
         asset_class_ids = ["id1", "id2"]
         mock_responses = [
-            AssetClassResponse(
+            SimpleNamespace(
                 id="id1", name="PE", description="Private Equity", status="active",
                 created_at=datetime.now(timezone.utc), updated_at=datetime.now(timezone.utc)
             ),
-            AssetClassResponse(
+            SimpleNamespace(
                 id="id2", name="RE", description="Real Estate", status="active",
                 created_at=datetime.now(timezone.utc), updated_at=datetime.now(timezone.utc)
             )
         ]
         mock_repository.get_by_ids.return_value = mock_responses
 
-        with patch('app.routers.asset_classes.asset_class_repository', mock_repository):
-            from app.routers.asset_classes import bulk_get_asset_classes
-            result = await bulk_get_asset_classes(asset_class_ids)
+        from app.routers.asset_classes import bulk_get_asset_classes
+        result = await bulk_get_asset_classes(asset_class_ids)
+        body = json.loads(result.body)
 
-            assert len(result) == 2
-            assert result[0].name == "PE"
-            assert result[1].name == "RE"
-            mock_repository.get_by_ids.assert_called_once_with(asset_class_ids)
+        assert len(body) == 2
+        assert body[0]["name"] == "PE"
+        assert body[1]["name"] == "RE"
+        mock_repository.get_by_ids.assert_called_once_with(asset_class_ids)
 
     @pytest.mark.asyncio
     async def test_bulk_get_asset_classes_empty_list(self, mock_repository):
         """Test bulk fetch with empty list."""
 
-        with patch('app.routers.asset_classes.asset_class_repository', mock_repository):
-            from app.routers.asset_classes import bulk_get_asset_classes
-            result = await bulk_get_asset_classes([])
+        from app.routers.asset_classes import bulk_get_asset_classes
+        result = await bulk_get_asset_classes([])
 
-            assert result == []
-            mock_repository.get_by_ids.assert_not_called()
+        assert result == []
+        mock_repository.get_by_ids.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_bulk_get_asset_classes_too_many_ids(self, mock_repository):
@@ -67,15 +83,14 @@ class TestAssetClassRouters:
 
         asset_class_ids = [f"id{i}" for i in range(101)]  # 101 IDs
 
-        with patch('app.routers.asset_classes.asset_class_repository', mock_repository):
-            from app.routers.asset_classes import bulk_get_asset_classes
+        from app.routers.asset_classes import bulk_get_asset_classes
 
-            with pytest.raises(HTTPException) as exc_info:
-                await bulk_get_asset_classes(asset_class_ids)
+        with pytest.raises(HTTPException) as exc_info:
+            await bulk_get_asset_classes(asset_class_ids)
 
-            assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
-            assert "Maximum 100 asset class IDs allowed" in str(
-                exc_info.value.detail)
+        assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
+        assert "Maximum 100 asset class IDs allowed" in str(
+            exc_info.value.detail)
 
     @pytest.mark.asyncio
     async def test_create_asset_class_success(self, mock_repository):
@@ -88,17 +103,15 @@ class TestAssetClassRouters:
             created_at=datetime.now(timezone.utc), updated_at=datetime.now(timezone.utc)
         )
 
-        mock_repository.get_by_name.return_value = None  # No existing asset class
         mock_repository.create.return_value = mock_response
 
-        with patch('app.routers.asset_classes.asset_class_repository', mock_repository):
-            from app.routers.asset_classes import create_asset_class
-            result = await create_asset_class(asset_class_data)
+        from app.routers.asset_classes import create_asset_class
+        result = await create_asset_class(asset_class_data)
 
-            assert result.data.name == "Test PE"
-            assert result.message == "Asset class created successfully"
-            mock_repository.get_by_name.assert_called_once_with("Test PE")
-            mock_repository.create.assert_called_once_with(asset_class_data)
+        assert result.data.name == "Test PE"
+        assert result.message == "Asset class created successfully"
+        mock_repository.get_by_name.assert_not_called()
+        mock_repository.create.assert_called_once_with(asset_class_data)
 
     @pytest.mark.asyncio
     async def test_create_asset_class_duplicate_name(self, mock_repository):
@@ -106,21 +119,17 @@ class TestAssetClassRouters:
 
         asset_class_data = AssetClassCreate(
             name="Existing PE", description="Test", status="active")
-        existing_asset_class = AssetClassResponse(
-            id="existing-id", name="Existing PE", description="Existing", status="active",
-            created_at=datetime.now(timezone.utc), updated_at=datetime.now(timezone.utc)
-        )
-        mock_repository.get_by_name.return_value = existing_asset_class
+        mock_repository.create.side_effect = DuplicateKeyError(
+            "Duplicate key")
 
-        with patch('app.routers.asset_classes.asset_class_repository', mock_repository):
-            from app.routers.asset_classes import create_asset_class
+        from app.routers.asset_classes import create_asset_class
 
-            with pytest.raises(HTTPException) as exc_info:
-                await create_asset_class(asset_class_data)
+        with pytest.raises(HTTPException) as exc_info:
+            await create_asset_class(asset_class_data)
 
-            assert exc_info.value.status_code == status.HTTP_409_CONFLICT
-            assert "already exists" in str(exc_info.value.detail)
-            mock_repository.create.assert_not_called()
+        assert exc_info.value.status_code == status.HTTP_409_CONFLICT
+        assert "already exists" in str(exc_info.value.detail)
+        mock_repository.create.assert_called_once_with(asset_class_data)
 
     @pytest.mark.asyncio
     async def test_create_asset_class_creation_failure(self, mock_repository):
@@ -128,23 +137,21 @@ class TestAssetClassRouters:
 
         asset_class_data = AssetClassCreate(
             name="Test PE", description="Test", status="active")
-        mock_repository.get_by_name.return_value = None
         mock_repository.create.return_value = None  # Creation failed
 
-        with patch('app.routers.asset_classes.asset_class_repository', mock_repository):
-            from app.routers.asset_classes import create_asset_class
+        from app.routers.asset_classes import create_asset_class
 
-            with pytest.raises(HTTPException) as exc_info:
-                await create_asset_class(asset_class_data)
+        with pytest.raises(HTTPException) as exc_info:
+            await create_asset_class(asset_class_data)
 
-            assert exc_info.value.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        assert exc_info.value.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
 
     @pytest.mark.asyncio
     async def test_list_asset_classes_success(self, mock_repository):
         """Test successful asset class listing."""
 
         mock_responses = [
-            AssetClassResponse(
+            SimpleNamespace(
                 id="id1", name="PE", description="Private Equity", status="active",
                 created_at=datetime.now(timezone.utc), updated_at=datetime.now(timezone.utc)
             )
@@ -152,17 +159,42 @@ class TestAssetClassRouters:
         mock_repository.get_all.return_value = mock_responses
         mock_repository.count.return_value = 1
 
-        with patch('app.routers.asset_classes.asset_class_repository', mock_repository):
-            from app.routers.asset_classes import list_asset_classes
-            result = await list_asset_classes(skip=0, limit=10, asset_status="active")
+        from app.routers.asset_classes import list_asset_classes
+        result = await list_asset_classes(skip=0, limit=10, asset_status="active")
+        body = json.loads(result.body)
+
+        assert len(body["data"]) == 1
+        assert body["total"] == 1
+        assert body["page"] == 1
+        assert body["size"] == 10
+        mock_repository.get_all.assert_called_once_with(
+            skip=0, limit=10, status="active")
+        mock_repository.count.assert_called_once_with(status="active")
+
+    @pytest.mark.asyncio
+    async def test_stream_asset_classes_success(self, mock_repository):
+        """Test streaming asset classes as a JSON array."""
+
+        mock_responses = [
+            SimpleNamespace(
+                id=f"id{i}", name=f"AC{i}", description=None, status="active",
+                created_at=datetime.now(timezone.utc), updated_at=datetime.now(timezone.utc)
+            )
+            for i in range(3)
+        ]
+
+        async def mock_stream_all(status=None):
+            for asset_class in mock_responses:
+                yield asset_class
 
-            assert len(result.data) == 1
-            assert result.total == 1
-            assert result.page == 1
-            assert result.size == 10
-            mock_repository.get_all.assert_called_once_with(
-                skip=0, limit=10, status="active")
-            mock_repository.count.assert_called_once_with(status="active")
+        mock_repository.stream_all = mock_stream_all
+
+        from app.routers.asset_classes import stream_asset_classes
+        result = await stream_asset_classes(asset_status=None)
+        chunks = [chunk async for chunk in result.body_iterator]
+        body = json.loads(b"".join(chunks))
+
+        assert [ac["id"] for ac in body] == ["id0", "id1", "id2"]
 
     @pytest.mark.asyncio
     async def test_bulk_create_asset_classes_success(self, mock_repository):
@@ -175,37 +207,49 @@ class TestAssetClassRouters:
                 name="RE", description="Real Estate", status="active")
         ]
         mock_responses = [
-            AssetClassResponse(
+            SimpleNamespace(
                 id="id1", name="PE", description="Private Equity", status="active",
                 created_at=datetime.now(timezone.utc), updated_at=datetime.now(timezone.utc)
             ),
-            AssetClassResponse(
+            SimpleNamespace(
                 id="id2", name="RE", description="Real Estate", status="active",
                 created_at=datetime.now(timezone.utc), updated_at=datetime.now(timezone.utc)
             )
         ]
         mock_repository.bulk_create.return_value = mock_responses
 
-        with patch('app.routers.asset_classes.asset_class_repository', mock_repository):
-            from app.routers.asset_classes import bulk_create_asset_classes
-            result = await bulk_create_asset_classes(asset_classes_data)
+        from app.routers.asset_classes import bulk_create_asset_classes
+        result = await bulk_create_asset_classes(asset_classes_data)
+        body = json.loads(result.body)
+
+        assert len(body) == 2
+        assert body[0]["name"] == "PE"
+        assert body[1]["name"] == "RE"
+        mock_repository.bulk_create.assert_called_once_with(
+            asset_classes_data)
+
+    def test_bulk_create_asset_classes_invalid_item(self, client, mock_repository):
+        """Test bulk creation rejects invalid items with a validation error."""
+
+        response = client.post("/api/asset-classes/bulk-create", json=[
+            {"name": "PE", "status": "active"},
+            {"name": "RE", "status": "archived"}
+        ])
 
-            assert len(result) == 2
-            assert result[0].name == "PE"
-            assert result[1].name == "RE"
-            mock_repository.bulk_create.assert_called_once_with(
-                asset_classes_data)
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert [error["loc"] for error in response.json()["detail"]] == [
+            ["body", 1, "status"]]
+        mock_repository.bulk_create.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_bulk_create_asset_classes_empty_list(self, mock_repository):
         """Test bulk creation with empty list."""
 
-        with patch('app.routers.asset_classes.asset_class_repository', mock_repository):
-            from app.routers.asset_classes import bulk_create_asset_classes
-            result = await bulk_create_asset_classes([])
+        from app.routers.asset_classes import bulk_create_asset_classes
+        result = await bulk_create_asset_classes([])
 
-            assert result == []
-            mock_repository.bulk_create.assert_not_called()
+        assert result == []
+        mock_repository.bulk_create.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_bulk_create_asset_classes_too_many(self, mock_repository):
@@ -217,12 +261,11 @@ class TestAssetClassRouters:
             for i in range(101)
         ]
 
-        with patch('app.routers.asset_classes.asset_class_repository', mock_repository):
-            from app.routers.asset_classes import bulk_create_asset_classes
+        from app.routers.asset_classes import bulk_create_asset_classes
 
-            with pytest.raises(HTTPException) as exc_info:
-                await bulk_create_asset_classes(asset_classes_data)
+        with pytest.raises(HTTPException) as exc_info:
+            await bulk_create_asset_classes(asset_classes_data)
 
-            assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
-            assert "Maximum 100 asset classes allowed" in str(
-                exc_info.value.detail)
+        assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
+        assert "Maximum 100 asset classes allowed" in str(
+            exc_info.value.detail)
@@ -2,6 +2,7 @@
 Configuration settings for the Commitment Service.
 """
 
+from functools import lru_cache
 from typing import Optional
 
 from pydantic_settings import BaseSettings
@@ -18,10 +19,23 @@ class Settings(BaseSettings):
     environment: str = "development"
     host: str = "0.0.0.0"
     port: int = 8003
+    thread_pool_size: int = 100
     database_url: str = "sqlite:///./commitments.db"
+    database_read_pool_size: int = 8
+    database_max_streams: int = 4
+    database_acquire_timeout_seconds: float = 10.0
+    health_count_ttl_seconds: float = 5.0
+    health_refresh_interval_seconds: float = 3.0
+    health_stale_after_seconds: float = 10.0
+    list_cache_size: int = 1024
+    list_cache_ttl_seconds: float = 5.0
     investor_service_url: str = "http://localhost:8002"
     asset_class_service_url: str = "http://localhost:8001"
     redis_url: Optional[str] = "redis://localhost:6379"
+    redis_max_connections: int = 32
+    event_batch_size: int = 100
+    event_queue_max_size: int = 10000
+    event_flush_interval_seconds: float = 0.01
     log_level: str = "INFO"
 
     class Config:
@@ -29,4 +43,19 @@ class Settings(BaseSettings):
         env_file_encoding = "utf-8"
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Build the settings on first use and reuse them afterwards.
+    """
+    return Settings()
+
+
+def __getattr__(name: str):
+    """
+    Keep `from app.config import settings` working without parsing the
+    environment at import time.
+    """
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
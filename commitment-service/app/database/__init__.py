@@ -3,15 +3,19 @@ Database module initialization.
 """
 
 from .connection import (
+    bulk_insert_commitments,
     connect_to_database,
     close_database_connection,
-    get_database,
+    get_reader,
+    get_writer,
     health_check
 )
 
 __all__ = [
+    "bulk_insert_commitments",
     "connect_to_database",
     "close_database_connection",
-    "get_database",
+    "get_reader",
+    "get_writer",
     "health_check"
 ]
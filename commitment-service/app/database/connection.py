@@ -2,48 +2,151 @@
 Database connection setup.
 """
 
+import asyncio
 import logging
+import time
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import aiosqlite
 
-from app.config import settings
+from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# WAL lets readers run alongside the writer and groups fsyncs at checkpoints;
+# it keeps -wal and -shm side files next to the database file. mmap serves hot
+# pages straight from the page cache instead of a read() syscall per page.
+CONNECTION_PRAGMAS = """
+PRAGMA foreign_keys = ON;
+PRAGMA journal_mode = WAL;
+PRAGMA synchronous = NORMAL;
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -65536;
+PRAGMA mmap_size = 268435456;
+"""
+
+# Idempotent DDL, applied in a single executescript round trip.
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS commitments (
+    id TEXT PRIMARY KEY,
+    investor_id TEXT NOT NULL,
+    asset_class_id TEXT NOT NULL,
+    amount DECIMAL(15,2) NOT NULL,
+    currency TEXT NOT NULL DEFAULT 'GBP',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- The compound indexes also serve plain investor_id / asset_class_id lookups.
+DROP INDEX IF EXISTS idx_commitments_investor_id;
+DROP INDEX IF EXISTS idx_commitments_asset_class_id;
+CREATE INDEX IF NOT EXISTS idx_commitments_investor_created ON commitments(investor_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_commitments_asset_class_created ON commitments(asset_class_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_commitments_created_at ON commitments(created_at);
+"""
+
+# sqlite3 reuses prepared statements by exact SQL text; the default cache of 100
+# is smaller than the set of precomputed list, breakdown and stream queries.
+STATEMENT_CACHE_SIZE = 256
+
+INSERT_COMMITMENT_SQL = """
+INSERT INTO commitments (id, investor_id, asset_class_id, amount, currency, created_at, updated_at)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Bulk inserts send many rows per statement; 142 rows x 7 columns stays under
+# the 999 bind-variable limit of older SQLite builds.
+INSERT_BATCH_ROWS = 142
+
+
+def build_multi_row_insert_sql(row_count: int) -> str:
+    """Build an INSERT with one VALUES tuple per row."""
+    values = ", ".join(["(?, ?, ?, ?, ?, ?, ?)"] * row_count)
+    return f"""
+INSERT INTO commitments (id, investor_id, asset_class_id, amount, currency, created_at, updated_at)
+VALUES {values}
+"""
+
+
+INSERT_BATCH_SQL = build_multi_row_insert_sql(INSERT_BATCH_ROWS)
+
 
 class Database:
     """
     Database connection manager for SQLite.
+
+    Writes go through a single writer connection, serialized by write_lock so
+    transactions never interleave. Reads borrow a query_only connection from
+    read_pool, which WAL lets run alongside the writer. Streams open their own
+    connection, limited by stream_slots, so a slow consumer never holds a
+    pooled reader.
     """
-    connection: Optional[aiosqlite.Connection] = None
+    writer: Optional[aiosqlite.Connection] = None
+    write_lock: Optional[asyncio.Lock] = None
+    readers: List[aiosqlite.Connection] = []
+    read_pool: Optional[asyncio.Queue] = None
+    stream_slots: Optional[asyncio.Semaphore] = None
 
 
 db = Database()
 
+# COUNT(*) scans the table, so health checks reuse the last count for a short TTL.
+_commitment_count_cache: Dict[str, Any] = {"value": 0, "expires_at": 0.0}
+
+
+@lru_cache(maxsize=1)
+def get_database_path() -> str:
+    """
+    Resolve the SQLite file path from the settings and create its directory, once.
+    """
+    db_path = get_settings().database_url.removeprefix("sqlite:///")
+    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+    return db_path
+
+
+async def open_connection(db_path: str, read_only: bool = False) -> aiosqlite.Connection:
+    """
+    Open a pooled connection with the service PRAGMAs applied once, up front.
+    """
+    connection = await aiosqlite.connect(
+        db_path, cached_statements=STATEMENT_CACHE_SIZE)
+    pragmas = CONNECTION_PRAGMAS + \
+        ("PRAGMA query_only = ON;" if read_only else "")
+    await connection.executescript(pragmas)
+    return connection
+
 
 async def connect_to_database():
     """
-    Create database connection and initialize schema if needed.
+    Create the writer and reader connections and initialize schema if needed.
     """
     try:
-        db_path = settings.database_url.replace("sqlite:///", "")
-        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        db_path = get_database_path()
 
-        logger.info("Connecting to SQLite database at %s", db_path)
+        logger.debug("Connecting to SQLite database at %s", db_path)
 
-        db.connection = await aiosqlite.connect(db_path)
-
-        # Enable foreign key constraints
-        await db.connection.execute("PRAGMA foreign_keys = ON")
+        db.writer = await open_connection(db_path)
+        db.write_lock = asyncio.Lock()
 
         # Initialize schema
         await init_database_schema()
 
-        await db.connection.commit()
+        await db.writer.commit()
+
+        db.readers = list(await asyncio.gather(*(
+            open_connection(db_path, read_only=True)
+            for _ in range(get_settings().database_read_pool_size)
+        )))
+        db.read_pool = asyncio.Queue()
+        for reader in db.readers:
+            db.read_pool.put_nowait(reader)
+        db.stream_slots = asyncio.Semaphore(get_settings().database_max_streams)
 
-        logger.info("Successfully connected to SQLite database: %s", db_path)
+        logger.info("Successfully connected to SQLite database: %s (%d readers)",
+                    db_path, len(db.readers))
 
     except Exception as e:
         logger.error("Failed to connect to database: %s", e)
@@ -52,11 +155,18 @@ async def connect_to_database():
 
 async def close_database_connection():
     """
-    Close database connection.
+    Close the reader and writer connections.
     """
     try:
-        if db.connection:
-            await db.connection.close()
+        for reader in db.readers:
+            await reader.close()
+        db.readers = []
+        db.read_pool = None
+        db.stream_slots = None
+
+        if db.writer:
+            await db.writer.close()
+            db.writer = None
             logger.info("Disconnected from SQLite database")
     except Exception as e:
         logger.error("Error closing database connection: %s", e)
@@ -67,66 +177,110 @@ async def init_database_schema():
     Initialize database schema with tables and indexes.
     """
     try:
-        logger.info("Initializing database schema...")
+        logger.debug("Initializing database schema...")
 
-        if db.connection is None:
+        if db.writer is None:
             raise RuntimeError(
                 "Database not connected. Call connect_to_database() first.")
 
-        await db.connection.execute("""
-            CREATE TABLE IF NOT EXISTS commitments (
-                id TEXT PRIMARY KEY,
-                investor_id TEXT NOT NULL,
-                asset_class_id TEXT NOT NULL,
-                amount DECIMAL(15,2) NOT NULL,
-                currency TEXT NOT NULL DEFAULT 'GBP',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        # await db.connection.execute("""
-        #     CREATE TABLE IF NOT EXISTS commitment_details_view (
-        #         id TEXT PRIMARY KEY,
-        #         investor_id TEXT NOT NULL,
-        #         investor_name TEXT NOT NULL,
-        #         investor_type TEXT NOT NULL,
-        #         investor_country TEXT NOT NULL,
-        #         asset_class_id TEXT NOT NULL,
-        #         asset_class_name TEXT NOT NULL,
-        #         amount DECIMAL(15,2) NOT NULL,
-        #         currency TEXT NOT NULL,
-        #         created_at TIMESTAMP
-        #     )
-        # """)
-
-        indexes = [
-            "CREATE INDEX IF NOT EXISTS idx_commitments_investor_id ON commitments(investor_id)",
-            "CREATE INDEX IF NOT EXISTS idx_commitments_asset_class_id ON commitments(asset_class_id)",
-            "CREATE INDEX IF NOT EXISTS idx_commitments_created_at ON commitments(created_at)",
-            # "CREATE INDEX IF NOT EXISTS idx_commitment_details_investor_id ON commitment_details_view(investor_id)",
-            # "CREATE INDEX IF NOT EXISTS idx_commitment_details_asset_class_id ON commitment_details_view(asset_class_id)",
-            # "CREATE INDEX IF NOT EXISTS idx_commitment_details_amount ON commitment_details_view(amount)"
-        ]
-
-        for index_sql in indexes:
-            await db.connection.execute(index_sql)
-
-        logger.info("Database schema initialized successfully")
+        await db.writer.executescript(SCHEMA_SQL)
+
+        logger.debug("Database schema initialized successfully")
 
     except Exception as e:
         logger.error("Failed to initialize database schema: %s", e)
         raise
 
 
-def get_database() -> Optional[aiosqlite.Connection]:
+@asynccontextmanager
+async def get_reader() -> AsyncIterator[aiosqlite.Connection]:
+    """
+    Borrow a read-only connection from the pool for the duration of the block.
+    """
+    pool = db.read_pool
+    if pool is None:
+        raise RuntimeError(
+            "Database not connected. Call connect_to_database() first.")
+
+    # asyncio.timeout cancels the get() itself; wait_for could time out after the
+    # get() completed and drop the dequeued connection from the pool for good.
+    reader: Optional[aiosqlite.Connection] = None
+    try:
+        async with asyncio.timeout(get_settings().database_acquire_timeout_seconds):
+            reader = await pool.get()
+    except BaseException:
+        if reader is not None:
+            pool.put_nowait(reader)
+        raise
+
+    try:
+        yield reader
+    finally:
+        pool.put_nowait(reader)
+
+
+@asynccontextmanager
+async def get_stream_reader() -> AsyncIterator[aiosqlite.Connection]:
+    """
+    Open a dedicated read-only connection for one long-lived stream.
+
+    At most database_max_streams are open at once; waiting for a slot times out
+    like get_reader, without leaking the slot.
+    """
+    slots = db.stream_slots
+    if slots is None:
+        raise RuntimeError(
+            "Database not connected. Call connect_to_database() first.")
+
+    acquired = False
+    try:
+        async with asyncio.timeout(get_settings().database_acquire_timeout_seconds):
+            acquired = await slots.acquire()
+    except BaseException:
+        if acquired:
+            slots.release()
+        raise
+
+    try:
+        reader = await open_connection(get_database_path(), read_only=True)
+        try:
+            yield reader
+        finally:
+            await reader.close()
+    finally:
+        slots.release()
+
+
+@asynccontextmanager
+async def get_writer() -> AsyncIterator[aiosqlite.Connection]:
     """
-    Get the database connection instance.
+    Hold the writer connection for one transaction, rolling back on error.
     """
-    if db.connection is None:
+    if db.writer is None or db.write_lock is None:
         raise RuntimeError(
             "Database not connected. Call connect_to_database() first.")
-    return db.connection
+
+    async with db.write_lock:
+        try:
+            yield db.writer
+        except BaseException:
+            await db.writer.rollback()
+            raise
+
+
+async def bulk_insert_commitments(rows: List[Tuple[Any, ...]]) -> None:
+    """
+    Insert commitment rows in one explicit transaction so a batch costs a single commit,
+    sending up to INSERT_BATCH_ROWS rows per multi-row INSERT statement.
+    """
+    async with get_writer() as writer:
+        await writer.execute("BEGIN")
+        for start in range(0, len(rows), INSERT_BATCH_ROWS):
+            chunk = rows[start:start + INSERT_BATCH_ROWS]
+            sql = INSERT_BATCH_SQL if len(chunk) == INSERT_BATCH_ROWS \
+                else build_multi_row_insert_sql(len(chunk))
+            await writer.execute(sql, [value for row in chunk for value in row])
+        await writer.commit()
 
 
 async def health_check() -> Dict[str, Any]:
@@ -134,33 +288,44 @@ async def health_check() -> Dict[str, Any]:
     Check database connection health.
     """
     try:
-        if db.connection is None:
+        if db.read_pool is None:
             return {
                 "status": "unhealthy",
                 "error": "No database connection"
             }
 
-        cursor = await db.connection.execute("SELECT 1")
-        result = await cursor.fetchone()
+        now = time.monotonic()
+        refresh_count = now >= _commitment_count_cache["expires_at"]
 
-        if result and result[0] == 1:
-            cursor = await db.connection.execute("SELECT COUNT(*) FROM commitments")
-            count_result = await cursor.fetchone()
-            commitment_count = count_result[0] if count_result else 0
+        # One round trip per probe: the liveness query also carries the count when it is due.
+        async with get_reader() as reader:
+            if refresh_count:
+                cursor = await reader.execute(
+                    "SELECT 1, (SELECT COUNT(*) FROM commitments)")
+            else:
+                cursor = await reader.execute("PRAGMA user_version")
+            result = await cursor.fetchone()
 
-            return {
-                "status": "healthy",
-                "database_type": "SQLite",
-                "database_path": settings.database_url,
-                "commitment_count": commitment_count,
-                "foreign_keys_enabled": True
-            }
-        else:
+        if result is None:
             return {
                 "status": "unhealthy",
                 "error": "Database query failed"
             }
 
+        if refresh_count:
+            _, _commitment_count_cache["value"] = result
+            _commitment_count_cache["expires_at"] = (
+                now + get_settings().health_count_ttl_seconds)
+        commitment_count = _commitment_count_cache["value"]
+
+        return {
+            "status": "healthy",
+            "database_type": "SQLite",
+            "database_path": get_settings().database_url,
+            "commitment_count": commitment_count,
+            "foreign_keys_enabled": True
+        }
+
     except Exception as e:
         logger.error("Database health check failed: %s", e)
         return {
@@ -5,13 +5,17 @@ This module defines the main FastAPI application for the Commitment Service,
 following the same patterns as the Investor Service.
 """
 
+import asyncio
 import logging
-from contextlib import asynccontextmanager
+import time
+from contextlib import asynccontextmanager, suppress
+from typing import Any, Dict
 
+import anyio.to_thread
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
-from app.config import settings
+from app.config import get_settings
 from app.database import close_database_connection, connect_to_database
 from app.database import health_check as db_health_check
 from app.routers import commitments_router
@@ -19,6 +23,22 @@ from app.services import event_publisher
 
 logger = logging.getLogger(__name__)
 
+# Latest database health, refreshed in the background so probes never touch the DB.
+_last_health: Dict[str, Any] = {"database": None, "updated_at": 0.0}
+
+
+async def _refresh_health():
+    """
+    Re-check database health on a fixed interval until cancelled.
+    """
+    while True:
+        try:
+            _last_health["database"] = await db_health_check()
+            _last_health["updated_at"] = time.monotonic()
+        except Exception as e:
+            logger.error("Background health refresh failed: %s", e)
+        await asyncio.sleep(get_settings().health_refresh_interval_seconds)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -26,6 +46,10 @@ async def lifespan(app: FastAPI):
     Handle application startup and shutdown events.
     """
     logger.info("Starting up Commitment Service...")
+    settings = get_settings()
+    # Sync dependencies and fallbacks run in anyio's threadpool, which defaults to 40 threads.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = \
+        settings.thread_pool_size
     try:
         await connect_to_database()
         await event_publisher.connect()
@@ -34,23 +58,31 @@ async def lifespan(app: FastAPI):
         logger.error("Failed to connect to database: %s", e)
         raise
 
+    health_task = asyncio.create_task(_refresh_health())
+
     yield
 
     logger.info("Shutting down Commitment Service...")
+    health_task.cancel()
+    # Let an in-flight refresh finish unwinding before the database closes.
+    with suppress(asyncio.CancelledError):
+        await health_task
     await close_database_connection()
     await event_publisher.disconnect()
     logger.info("All connections closed")
 
 
+# uvicorn imports app.main:app, so the app itself is built from settings on import.
 app = FastAPI(
-    title=settings.app_name,
-    version=settings.app_version,
+    title=get_settings().app_name,
+    version=get_settings().app_version,
     description="A service for managing investment commitments in the investment platform",
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
     lifespan=lifespan,
-    debug=settings.debug
+    debug=get_settings().debug,
+    default_response_class=ORJSONResponse
 )
 
 app.include_router(commitments_router, prefix="/api")
@@ -61,6 +93,7 @@ async def root():
     """
     Root endpoint with service information.
     """
+    settings = get_settings()
     return {
         "service": settings.app_name,
         "version": settings.app_version,
@@ -75,11 +108,21 @@ async def health_check():
     """
     Health check endpoint for monitoring and load balancers.
 
+    Reports the last background database check, so probes add no DB load.
+
     Returns:
         Dict with service health status, database connectivity, and external service status
     """
+    settings = get_settings()
     try:
-        db_health = await db_health_check()
+        db_health = _last_health["database"]
+        age = time.monotonic() - _last_health["updated_at"]
+
+        if db_health is None or age > settings.health_stale_after_seconds:
+            db_health = {
+                "status": "unhealthy",
+                "error": "Database health has not been refreshed recently"
+            }
 
         is_db_healthy = db_health["status"] == "healthy"
         is_healthy = is_db_healthy
@@ -115,7 +158,7 @@ async def http_exception_handler(request, exc: HTTPException):
     """Custom HTTP exception handler with logging."""
     logger.error("HTTP exception: %s %s - %s",
                  request.method, request.url, exc.detail)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"detail": exc.detail}
     )
@@ -123,9 +166,12 @@ async def http_exception_handler(request, exc: HTTPException):
 
 if __name__ == "__main__":
     import uvicorn
+    settings = get_settings()
     uvicorn.run(
         "app.main:app",
         host=settings.host,
         port=settings.port,
-        reload=settings.debug
+        reload=settings.debug,
+        loop="asyncio" if settings.debug else "uvloop",
+        http="httptools"
     )
@@ -3,12 +3,12 @@ Commitment models for pure commitment service.
 """
 import logging
 from datetime import datetime, timezone
-from decimal import Decimal
 from enum import Enum
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from uuid import uuid4
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+import msgspec
+from pydantic import BaseModel, ConfigDict, Field
 
 logger = logging.getLogger(__name__)
 
@@ -20,29 +20,29 @@ class Currency(str, Enum):
     EUR = "EUR"
 
 
+# Models are immutable and reject unknown fields; pydantic keeps field values in
+# the instance __dict__, so frozen is the closest it gets to __slots__.
+MODEL_CONFIG = ConfigDict(frozen=True, extra="forbid")
+
+
 class CommitmentBase(BaseModel):
     """Base commitment model with common fields."""
 
+    model_config = MODEL_CONFIG
+
     investor_id: str = Field(..., description="Investor identifier")
     asset_class_id: str = Field(..., description="Asset class identifier")
-    amount: Decimal = Field(..., gt=0, max_digits=15, decimal_places=2,
-                            description="Commitment amount")
+    # Stored as a float, so parse straight to one; lt keeps the DECIMAL(15,2) range.
+    amount: float = Field(..., gt=0, lt=1e13, description="Commitment amount")
     currency: Currency = Field(
         default=Currency.GBP, description="Currency code")
 
-    @field_validator('amount')
-    @classmethod
-    def validate_amount(cls, v):
-        """Ensure amount is positive and has max 2 decimal places."""
-        if v <= 0:
-            raise ValueError('Amount must be positive')
-        return v
-
 
 class CommitmentCreate(CommitmentBase):
     """Model for creating a new commitment via API."""
 
     model_config = ConfigDict(
+        **MODEL_CONFIG,
         json_schema_extra={
             "example": {
                 "investor_id": "123e4567-e89b-12d3-a456-426614174000",
@@ -66,9 +66,7 @@ class CommitmentResponse(BaseModel):
     updated_at: datetime
 
     model_config = ConfigDict(
-        json_encoders={
-            datetime: lambda v: v.isoformat()
-        },
+        **MODEL_CONFIG,
         json_schema_extra={
             "example": {
                 "id": "456e7890-e12b-34c5-d678-901234567890",
@@ -85,12 +83,18 @@ class CommitmentResponse(BaseModel):
 
 class CommitmentSummaryResult(BaseModel):
     """Type definition for commitment summary for an investor."""
+
+    model_config = MODEL_CONFIG
+
     count: int
     total_amount: float
 
 
 class AssetBreakdown(BaseModel):
     """Asset class breakdown for an investor."""
+
+    model_config = MODEL_CONFIG
+
     asset_class_id: str
     total_amount: float
     commitment_count: int
@@ -100,18 +104,22 @@ class AssetBreakdown(BaseModel):
 class CommitmentListResponse(BaseModel):
     """Model for paginated commitment list responses."""
 
+    model_config = MODEL_CONFIG
+
     commitments: List[CommitmentResponse]
     asset_breakdowns: List[AssetBreakdown]
     total: int
     total_amount: float
-    page: int = Field(ge=1)
-    size: int = Field(ge=1, le=100)
+    # The router's Query constraints already bound page and size.
+    page: int
+    size: int
     total_pages: int
     has_next: bool
     has_prev: bool
 
 
-class CommitmentCreatedEvent(BaseModel):
+class CommitmentCreatedEvent(msgspec.Struct, kw_only=True):
+    """Event published to investor_updates when a commitment is created."""
     event_type: str = "commitment_created"
     commitment_id: str
     investor_id: str
@@ -120,25 +128,111 @@ class CommitmentCreatedEvent(BaseModel):
     currency: str
 
 
-def convert_commitment_from_db(row: Optional[dict]) -> Optional[CommitmentResponse]:
+class CommitmentResponseStruct(msgspec.Struct):
+    """msgspec mirror of CommitmentResponse used to encode responses."""
+    id: str
+    investor_id: str
+    asset_class_id: str
+    amount: float
+    currency: Currency
+    created_at: datetime
+    updated_at: datetime
+
+
+class AssetBreakdownStruct(msgspec.Struct):
+    """msgspec mirror of AssetBreakdown."""
+    asset_class_id: str
+    total_amount: float
+    commitment_count: int
+    percentage_of_total: float
+
+
+class CommitmentListResponseStruct(msgspec.Struct):
+    """msgspec mirror of CommitmentListResponse."""
+    commitments: List[CommitmentResponseStruct]
+    asset_breakdowns: List[AssetBreakdownStruct]
+    total: int
+    total_amount: float
+    page: int
+    size: int
+    total_pages: int
+    has_next: bool
+    has_prev: bool
+
+
+_ENCODER = msgspec.json.Encoder()
+
+
+def _to_struct(commitment: CommitmentResponse) -> CommitmentResponseStruct:
+    return CommitmentResponseStruct(**commitment.__dict__)
+
+
+def encode_commitment(commitment: CommitmentResponse) -> bytes:
+    """Encode a single commitment as a JSON object."""
+    return _ENCODER.encode(_to_struct(commitment))
+
+
+def encode_commitments(commitments: List[CommitmentResponse]) -> bytes:
+    """Encode commitments as a JSON array."""
+    return _ENCODER.encode([_to_struct(c) for c in commitments])
+
+
+def encode_commitments_ndjson(commitments: List[CommitmentResponse]) -> bytes:
+    """Encode commitments as newline-delimited JSON into one reused buffer."""
+    buffer = bytearray()
+    for commitment in commitments:
+        _ENCODER.encode_into(_to_struct(commitment), buffer, len(buffer))
+        buffer.extend(b"\n")
+    return bytes(buffer)
+
+
+def encode_commitment_list(result: dict) -> bytes:
+    """Encode a paginated commitment list result from the repository."""
+    return _ENCODER.encode(CommitmentListResponseStruct(
+        commitments=[_to_struct(c) for c in result["commitments"]],
+        asset_breakdowns=[AssetBreakdownStruct(**b.__dict__)
+                          for b in result["asset_breakdowns"]],
+        total=result["total"],
+        total_amount=result["total_amount"],
+        page=result["page"],
+        size=result["size"],
+        total_pages=result["total_pages"],
+        has_next=result["has_next"],
+        has_prev=result["has_prev"]
+    ))
+
+
+def _parse_timestamp(value):
+    """Parse an ISO timestamp stored by SQLite; datetimes pass through."""
+    if isinstance(value, str):
+        # Python 3.11+ reads the trailing Z itself, so no rewritten copy is needed.
+        return datetime.fromisoformat(value)
+    return value
+
+
+def convert_commitment_from_row(row: Optional[Sequence]) -> Optional[CommitmentResponse]:
     """
-    Convert a SQLite row to a CommitmentResponse model.
+    Convert a positional SQLite row to a CommitmentResponse model.
 
-    Handles type conversions and field mapping.
+    The row must follow the column order id, investor_id, asset_class_id,
+    amount, currency, created_at, updated_at used by every commitment SELECT.
     """
     if row is None:
         return None
 
     try:
-        if "amount" in row:
-            row["amount"] = float(row["amount"])
-
-        for field in ["created_at", "updated_at"]:
-            if field in row and isinstance(row[field], str):
-                row[field] = datetime.fromisoformat(
-                    row[field].replace('Z', '+00:00'))
-
-        return CommitmentResponse(**row)
+        created_at = _parse_timestamp(row[5])
+        # Commitments are never updated, so both stamps usually match; parse once.
+        updated_at = created_at if row[6] == row[5] else _parse_timestamp(row[6])
+        return CommitmentResponse.model_construct(
+            id=row[0],
+            investor_id=row[1],
+            asset_class_id=row[2],
+            amount=float(row[3]),
+            currency=Currency(row[4]),
+            created_at=created_at,
+            updated_at=updated_at
+        )
     except Exception as e:
         logger.error("Error converting commitment from DB: %s", e)
         return None
@@ -157,6 +251,4 @@ def prepare_commitment_for_db(commitment: CommitmentCreate) -> dict:
         "updated_at": now
     })
 
-    commitment_dict["amount"] = float(commitment_dict["amount"])
-
     return commitment_dict
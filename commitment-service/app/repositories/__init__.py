@@ -2,21 +2,23 @@
 Repository factory and dependency injection.
 """
 
-from app.database.connection import get_database
 from app.repositories.commitment_repository import CommitmentRepository
 
+# The repository holds no connection of its own, so one instance serves every request.
+commitment_repository = CommitmentRepository()
+
 
 def get_commitment_repository() -> CommitmentRepository:
     """
-    Get a commitment repository instance using aiosqlite.
+    Get the commitment repository using aiosqlite.
 
     This function is used for dependency injection in FastAPI endpoints.
+    The repository borrows reader and writer connections per operation.
 
     Returns:
-        CommitmentRepository: Repository instance with async database connection
+        CommitmentRepository: Repository instance backed by the connection pool
     """
-    connection = get_database()
-    return CommitmentRepository(connection)
+    return commitment_repository
 
 
 # Export the main function for easy importing
@@ -4,24 +4,86 @@ Commitment repository for database operations.
 
 import asyncio
 import logging
-from datetime import datetime
-from typing import Any, List, Optional, Tuple, TypedDict
-
-import aiosqlite
-
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from itertools import product
+from typing import Any, AsyncIterator, List, Optional, Tuple, TypedDict
+from uuid import uuid4
+
+from app.config import get_settings
+from app.database.connection import (INSERT_COMMITMENT_SQL,
+                                     bulk_insert_commitments, get_reader,
+                                     get_stream_reader, get_writer)
 from app.models.commitment import (AssetBreakdown, CommitmentCreate,
                                    CommitmentResponse,
-                                   convert_commitment_from_db,
+                                   convert_commitment_from_row,
                                    prepare_commitment_for_db)
 from app.services import event_publisher
 
 logger = logging.getLogger(__name__)
 
+SORT_FIELDS = frozenset({
+    "id", "investor_id", "asset_class_id", "amount", "currency", "created_at", "updated_at"
+})
+
+
+def _where_clause(fields: Tuple[str, ...]) -> str:
+    """Build a WHERE clause with one equality placeholder per field."""
+    if not fields:
+        return ""
+    return "WHERE " + " AND ".join(f"{field} = ?" for field in fields)
+
 
-class CommitmentFilters(TypedDict, total=False):
-    investor_id: str | None
-    asset_class_id: str | None
-    currency: str | None
+def _present(*fields: Tuple[str, bool]) -> Tuple[str, ...]:
+    """Keep the names of the enabled filter fields, in order."""
+    return tuple(name for name, enabled in fields if enabled)
+
+
+# List queries are specialised up front for every filter combination and sort,
+# keyed by (has_investor, has_asset_class, has_currency, sort_by, sort_dir).
+LIST_SQL = {
+    (has_investor, has_asset_class, has_currency, sort_by, sort_dir): f"""
+        SELECT id, investor_id, asset_class_id, amount, currency, created_at, updated_at
+        FROM commitments
+        {_where_clause(_present(("investor_id", has_investor), ("asset_class_id", has_asset_class), ("currency", has_currency)))}
+        ORDER BY {sort_by} {sort_dir}
+        LIMIT ? OFFSET ?
+    """
+    for has_investor, has_asset_class, has_currency in product((False, True), repeat=3)
+    for sort_by in SORT_FIELDS
+    for sort_dir in ("ASC", "DESC")
+}
+
+# Breakdown queries ignore the asset class filter, keyed by (has_investor, has_currency).
+BREAKDOWN_SQL = {
+    (has_investor, has_currency): f"""
+        SELECT asset_class_id, SUM(amount), COUNT(*)
+        FROM commitments
+        {_where_clause(_present(("investor_id", has_investor), ("currency", has_currency)))}
+        GROUP BY asset_class_id
+        ORDER BY SUM(amount) DESC
+    """
+    for has_investor, has_currency in product((False, True), repeat=2)
+}
+
+
+# Streams read every matching row newest first, keyed by
+# (has_investor, has_asset_class, has_currency).
+STREAM_SQL = {
+    (has_investor, has_asset_class, has_currency): f"""
+        SELECT id, investor_id, asset_class_id, amount, currency, created_at, updated_at
+        FROM commitments
+        {_where_clause(_present(("investor_id", has_investor), ("asset_class_id", has_asset_class), ("currency", has_currency)))}
+        ORDER BY created_at DESC
+    """
+    for has_investor, has_asset_class, has_currency in product((False, True), repeat=3)
+}
+
+STREAM_BATCH_SIZE = 500
+
+# Column order of INSERT_COMMITMENT_SQL.
+CommitmentDbRow = Tuple[str, str, str, float, str, datetime, datetime]
 
 
 class PaginationInfo(TypedDict):
@@ -61,31 +123,50 @@ class CommitmentListResult(PaginationInfo):
     total_amount: float
 
 
+# Recent list results keyed by (version, query args) -> (expires_at, result).
+# Writes bump the version, so stale entries stop matching and age out of the LRU.
+_list_cache: "OrderedDict[Tuple[Any, ...], Tuple[float, CommitmentListResult]]" = OrderedDict()
+_list_cache_version = 0
+
+
+def _get_cached_list(key: Tuple[Any, ...]) -> Optional[CommitmentListResult]:
+    """Return a live cached list result, marking it most recently used."""
+    entry = _list_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, result = entry
+    if time.monotonic() >= expires_at:
+        del _list_cache[key]
+        return None
+    _list_cache.move_to_end(key)
+    return result
+
+
+def _cache_list(key: Tuple[Any, ...], result: CommitmentListResult) -> None:
+    """Store a list result, evicting the least recently used entries."""
+    settings = get_settings()
+    _list_cache[key] = (time.monotonic() + settings.list_cache_ttl_seconds, result)
+    _list_cache.move_to_end(key)
+    while len(_list_cache) > settings.list_cache_size:
+        _list_cache.popitem(last=False)
+
+
+def invalidate_list_cache() -> None:
+    """Make every cached list result stale after a write."""
+    global _list_cache_version
+    _list_cache_version += 1
+
+
 class CommitmentRepository:
     """
     Repository for commitment database operations.
     """
 
-    def __init__(self, connection: aiosqlite.Connection):
-        """
-        Initialize the repository with a database connection.
-        """
-        self.connection = connection
-
-    def __build_where_clause(self, filters: CommitmentFilters) -> tuple[str, list[Any]]:
-        """
-        Builds a SQL WHERE clause and parameter list from a dict of filters.
-        """
-        conditions = []
-        params = []
-
-        for field, value in filters.items():
-            if value is not None:
-                conditions.append(f"{field} = ?")
-                params.append(value)
-
-        clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
-        return clause, params
+    async def __fetch_all(self, sql: str, params: list[Any]) -> list[Any]:
+        """Run a read query on a pooled reader connection and fetch every row."""
+        async with get_reader() as reader:
+            cursor = await reader.execute(sql, params)
+            return await cursor.fetchall()
 
     def __get_pagination_info(self, skip, limit, total) -> PaginationInfo:
         """Gets the pagination data"""
@@ -107,48 +188,41 @@ class CommitmentRepository:
             logger.info("Creating commitment for investor: %s",
                         commitment_data.investor_id)
 
-            await self.connection.execute("""
-                INSERT INTO commitments (id, investor_id, asset_class_id, amount, currency, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                db_doc["id"],
-                db_doc["investor_id"],
-                db_doc["asset_class_id"],
-                db_doc["amount"],
-                db_doc["currency"],
-                db_doc["created_at"],
-                db_doc["updated_at"]
-            ))
-
-            await self.connection.commit()
-
-            created_commitment = await self.get_commitment_by_id(db_doc["id"])
-
-            if created_commitment:
-                logger.info(
-                    "Successfully created commitment with ID: %s", db_doc["id"])
-
-                await event_publisher.publish_commitment_created({
-                    "id": created_commitment.id,
-                    "investor_id": created_commitment.investor_id,
-                    "asset_class_id": created_commitment.asset_class_id,
-                    "amount": created_commitment.amount,
-                    "currency": created_commitment.currency
-                })
-
-                return created_commitment
-            else:
-                logger.error(
-                    "Failed to retrieve created commitment with id: %s", db_doc["id"])
-                return None
+            async with get_writer() as writer:
+                await writer.execute(INSERT_COMMITMENT_SQL, (
+                    db_doc["id"],
+                    db_doc["investor_id"],
+                    db_doc["asset_class_id"],
+                    db_doc["amount"],
+                    db_doc["currency"],
+                    db_doc["created_at"],
+                    db_doc["updated_at"]
+                ))
+
+                await writer.commit()
+
+            invalidate_list_cache()
+
+            # The row was built here, so respond from it rather than reading it back.
+            created_commitment = CommitmentResponse.model_construct(**db_doc)
+
+            logger.info(
+                "Successfully created commitment with ID: %s", db_doc["id"])
+
+            await event_publisher.publish_commitment_created({
+                "id": created_commitment.id,
+                "investor_id": created_commitment.investor_id,
+                "asset_class_id": created_commitment.asset_class_id,
+                "amount": created_commitment.amount,
+                "currency": created_commitment.currency
+            })
+
+            return created_commitment
 
         except Exception as e:
             logger.error("Error creating commitment: %s", e)
-            await self.connection.rollback()
             return None
 
-    CommitmentDbRow = Tuple[str, str, str, float, str, datetime, datetime]
-
     async def bulk_create_commitments(self, commitments: List[CommitmentCreate]) -> List[CommitmentResponse]:
         """
         Bulk create multiple commitments efficiently.
@@ -165,82 +239,49 @@ class CommitmentRepository:
         try:
             logger.info("Bulk creating %d commitments", len(commitments))
 
-            # Prepare all documents for insertion
-            commitment_docs = []
-            commitment_ids = []
-
-            for commitment in commitments:
-                db_doc = prepare_commitment_for_db(commitment)
-                commitment_ids.append(db_doc["id"])
-                commitment_docs.append((
-                    db_doc["id"],
-                    db_doc["investor_id"],
-                    db_doc["asset_class_id"],
-                    db_doc["amount"],
-                    db_doc["currency"],
-                    db_doc["created_at"],
-                    db_doc["updated_at"]
-                ))
+            # Build the rows straight from the validated models: one timestamp
+            # for the whole batch and no per-row model_dump.
+            now = datetime.now(timezone.utc)
+            commitment_docs: List[CommitmentDbRow] = [
+                (str(uuid4()), commitment.investor_id, commitment.asset_class_id,
+                 commitment.amount, commitment.currency.value, now, now)
+                for commitment in commitments
+            ]
+            created_commitments = [
+                CommitmentResponse.model_construct(
+                    id=row[0],
+                    investor_id=commitment.investor_id,
+                    asset_class_id=commitment.asset_class_id,
+                    amount=commitment.amount,
+                    currency=commitment.currency,
+                    created_at=now,
+                    updated_at=now
+                )
+                for row, commitment in zip(commitment_docs, commitments)
+            ]
 
-            # Bulk insert using executemany
-            await self.connection.executemany("""
-                INSERT INTO commitments (id, investor_id, asset_class_id, amount, currency, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, commitment_docs)
-
-            await self.connection.commit()
-
-            # Fetch all created commitments in one query
-            placeholders = ','.join('?' for _ in commitment_ids)
-            cursor = await self.connection.execute(f"""
-                SELECT id, investor_id, asset_class_id, amount, currency, created_at, updated_at
-                FROM commitments
-                WHERE id IN ({placeholders})
-            """, commitment_ids)
-
-            rows = await cursor.fetchall()
-
-            created_commitments = []
-            for row in rows:
-                row_dict = {
-                    "id": row[0],
-                    "investor_id": row[1],
-                    "asset_class_id": row[2],
-                    "amount": row[3],
-                    "currency": row[4],
-                    "created_at": row[5],
-                    "updated_at": row[6]
-                }
-
-                commitment_response = convert_commitment_from_db(row_dict)
-                if commitment_response:
-                    created_commitments.append(commitment_response)
+            # The batch commits or rolls back as a whole, so the prepared
+            # responses are exactly what was stored.
+            await bulk_insert_commitments(commitment_docs)
+            invalidate_list_cache()
 
             logger.info("Successfully bulk created %d commitments",
                         len(created_commitments))
 
-            publish_tasks = [
-                event_publisher.publish_commitment_created({
+            await event_publisher.publish_commitments_bulk([
+                {
                     "id": commitment.id,
                     "investor_id": commitment.investor_id,
                     "asset_class_id": commitment.asset_class_id,
                     "amount": commitment.amount,
                     "currency": commitment.currency
-                }) for commitment in created_commitments
-            ]
-
-            results = await asyncio.gather(*publish_tasks, return_exceptions=True)
-
-            for result in results:
-                if isinstance(results, BaseException):
-                    logger.error("Concurrent task failed for commitment publish: %s",
-                                 result)
+                } for commitment in created_commitments
+            ])
 
             return created_commitments
 
         except Exception as e:
             logger.error("Error bulk creating commitments: %s", e)
-            await self.connection.rollback()
             return []
 
     async def get_commitment_by_id(self, commitment_id: str) -> Optional[CommitmentResponse]:
@@ -248,28 +289,49 @@ class CommitmentRepository:
         Get a commitment by ID.
         """
         try:
-            cursor = await self.connection.execute("""
-                SELECT id, investor_id, asset_class_id, amount, currency, created_at, updated_at
-                FROM commitments
-                WHERE id = ?
-            """, (commitment_id,))
+            async with get_reader() as reader:
+                cursor = await reader.execute("""
+                    SELECT id, investor_id, asset_class_id, amount, currency, created_at, updated_at
+                    FROM commitments
+                    WHERE id = ?
+                """, (commitment_id,))
 
-            row = await cursor.fetchone()
+                row = await cursor.fetchone()
 
-            if row:
-                # Convert row to dict
-                columns = [description[0]
-                           for description in cursor.description]
-                row_dict = dict(zip(columns, row))
-                return convert_commitment_from_db(row_dict)
-
-            return None
+            return convert_commitment_from_row(row)
 
         except Exception as e:
             logger.error(
                 "Database error retrieving commitment %s: %s", commitment_id, e)
             return None
 
+    async def stream_commitments(
+        self,
+        investor_id: Optional[str] = None,
+        asset_class_id: Optional[str] = None,
+        currency: Optional[str] = None
+    ) -> AsyncIterator[List[CommitmentResponse]]:
+        """
+        Stream every matching commitment, newest first, in batches of STREAM_BATCH_SIZE.
+
+        The stream reads on its own connection, held until the stream is
+        exhausted or closed, so it never ties up the shared reader pool.
+        """
+        asset_class_id = asset_class_id or None
+        currency = currency or None
+        sql = STREAM_SQL[(investor_id is not None, asset_class_id is not None,
+                          currency is not None)]
+        params = [value for value in (investor_id, asset_class_id, currency)
+                  if value is not None]
+
+        async with get_stream_reader() as reader:
+            async with reader.execute(sql, params) as cursor:
+                while rows := await cursor.fetchmany(STREAM_BATCH_SIZE):
+                    yield [
+                        commitment for commitment in map(convert_commitment_from_row, rows)
+                        if commitment
+                    ]
+
     async def get_commitments(
         self,
         skip: int = 0,
@@ -284,88 +346,73 @@ class CommitmentRepository:
         Fetch commitments with optional filters, pagination, and asset breakdowns.
         """
         try:
-            valid_sort_fields = {
-                "id", "investor_id", "asset_class_id", "amount", "currency", "created_at", "updated_at"
-            }
-            sort_by = sort_by if sort_by in valid_sort_fields else "created_at"
+            sort_by = sort_by if sort_by in SORT_FIELDS else "created_at"
             sort_dir = "DESC" if sort_order.lower() == "desc" else "ASC"
-
-            filters: CommitmentFilters = {
-                "investor_id": investor_id,
-                "asset_class_id": asset_class_id or None,
-                "currency": currency or None
-            }
-            where_clause, params = self.__build_where_clause(filters)
-
-            asset_class_breakdown_filters: CommitmentFilters = {
-                "investor_id": investor_id,
-                "asset_class_id": None,
-                "currency": currency or None
-            }
-            asset_class_breakdown_where_clause, asset_class_breakdown_params = self.__build_where_clause(
-                asset_class_breakdown_filters)
-
-            count_sql = f"SELECT COUNT(*) FROM commitments {where_clause}"
-            count_cursor = await self.connection.execute(count_sql, params)
-            count_row = await count_cursor.fetchone()
-            total_count = count_row[0] if count_row else 0
-
-            total_sql = f"SELECT SUM(amount) FROM commitments {asset_class_breakdown_where_clause}"
-            total_cursor = await self.connection.execute(total_sql, asset_class_breakdown_params)
-            total_row = await total_cursor.fetchone()
-            total_amount = float(
-                total_row[0]) if total_row and total_row[0] else 0.0
-
-            asset_class_breakdown_sql = f"""
-                SELECT asset_class_id, SUM(amount), COUNT(*)
-                FROM commitments
-                {asset_class_breakdown_where_clause}
-                GROUP BY asset_class_id
-                ORDER BY SUM(amount) DESC
-            """
-            breakdown_cursor = await self.connection.execute(asset_class_breakdown_sql, asset_class_breakdown_params)
-            breakdown_rows = await breakdown_cursor.fetchall()
-
-            asset_breakdowns: List[AssetBreakdown] = []
-            for asset_class_id_val, asset_total, count in breakdown_rows:
-                if asset_class_id_val is None:
-                    continue
-
-                percentage = (asset_total / total_amount *
-                              100) if total_amount > 0 else 0.0
-                asset_breakdowns.append(
-                    AssetBreakdown(
-                        asset_class_id=asset_class_id_val,
-                        total_amount=float(asset_total),
-                        commitment_count=int(count),
-                        percentage_of_total=round(percentage, 2)
-                    )
+            asset_class_id = asset_class_id or None
+            currency = currency or None
+
+            cache_key = (_list_cache_version, investor_id, asset_class_id, currency,
+                         skip, limit, sort_by, sort_dir)
+            cached = _get_cached_list(cache_key)
+            if cached is not None:
+                return cached
+
+            has_investor = investor_id is not None
+            has_asset_class = asset_class_id is not None
+            has_currency = currency is not None
+
+            breakdown_params = [value for value in (investor_id, currency)
+                                if value is not None]
+            params = [value for value in (investor_id, asset_class_id, currency)
+                      if value is not None]
+
+            asset_class_breakdown_sql = BREAKDOWN_SQL[(has_investor, has_currency)]
+            main_sql = LIST_SQL[(has_investor, has_asset_class,
+                                 has_currency, sort_by, sort_dir)]
+
+            # The breakdown covers every asset class under the same investor/currency
+            # filters, so the grand total and the filtered count are derived from it
+            # instead of running separate SUM and COUNT queries.
+            breakdown_rows, rows = await asyncio.gather(
+                self.__fetch_all(asset_class_breakdown_sql, breakdown_params),
+                self.__fetch_all(main_sql, params + [limit, skip])
+            )
+
+            total_amount = float(sum(row[1] for row in breakdown_rows))
+            if has_asset_class:
+                total_count = next(
+                    (int(row[2]) for row in breakdown_rows if row[0] == asset_class_id), 0)
+            else:
+                total_count = sum(int(row[2]) for row in breakdown_rows)
+
+            # One scale factor for every row; the rows come straight from SQLite,
+            # so the breakdowns skip validation.
+            percent_scale = 100 / total_amount if total_amount > 0 else 0.0
+            asset_breakdowns: List[AssetBreakdown] = [
+                AssetBreakdown.model_construct(
+                    asset_class_id=asset_class_id_val,
+                    total_amount=float(asset_total),
+                    commitment_count=int(count),
+                    percentage_of_total=round(asset_total * percent_scale, 2)
                 )
-
-            main_sql = f"""
-                SELECT id, investor_id, asset_class_id, amount, currency, created_at, updated_at
-                FROM commitments
-                {where_clause}
-                ORDER BY {sort_by} {sort_dir}
-                LIMIT ? OFFSET ?
-            """
-            cursor = await self.connection.execute(main_sql, list(params) + [limit, skip])
-            rows = await cursor.fetchall()
-            columns = [col[0] for col in cursor.description]
+                for asset_class_id_val, asset_total, count in breakdown_rows
+                if asset_class_id_val is not None
+            ]
 
             commitments = [
-                commitment for commitment in (
-                    convert_commitment_from_db(dict(zip(columns, row))) for row in rows
-                ) if commitment
+                commitment for commitment in map(convert_commitment_from_row, rows)
+                if commitment
             ]
 
-            return CommitmentListResult({
+            result = CommitmentListResult({
                 "commitments": commitments,
                 "asset_breakdowns": asset_breakdowns,  # Always ALL assets
                 "total": total_count,  # Count of filtered commitments
                 "total_amount": total_amount,  # Grand total for context
                 **self.__get_pagination_info(skip, limit, total_count)
             })
+            _cache_list(cache_key, result)
+            return result
 
         except Exception as e:
             logger.error("Database error querying commitments: %s", e)
@@ -3,12 +3,16 @@ FastAPI router for commitment endpoints.
 """
 
 import logging
-from typing import Optional
+from typing import AsyncIterator, Optional
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
+from fastapi import (APIRouter, Body, Depends, HTTPException, Query, Response,
+                     status)
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
 from app.models.commitment import (CommitmentCreate, CommitmentListResponse,
-                                   CommitmentResponse)
+                                   CommitmentResponse, encode_commitment,
+                                   encode_commitment_list, encode_commitments,
+                                   encode_commitments_ndjson)
 from app.repositories import get_commitment_repository
 from app.repositories.commitment_repository import CommitmentRepository
 
@@ -17,6 +21,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter(
     prefix="/commitments",
     tags=["commitments"],
+    default_response_class=ORJSONResponse,
     responses={
         404: {"description": "Commitment not found"},
         422: {"description": "Validation error"},
@@ -35,7 +40,7 @@ router = APIRouter(
 async def create_commitment(
     commitment_data: CommitmentCreate,
     repo: CommitmentRepository = Depends(get_commitment_repository)
-) -> CommitmentResponse:
+) -> Response:
     """
     Create a new commitment - simplified without external validation.
 
@@ -67,7 +72,11 @@ async def create_commitment(
 
         logger.info("Successfully created commitment with ID: %s",
                     created_commitment.id)
-        return created_commitment
+        return Response(
+            content=encode_commitment(created_commitment),
+            status_code=status.HTTP_201_CREATED,
+            media_type="application/json"
+        )
 
     except HTTPException:
         raise
@@ -79,6 +88,38 @@ async def create_commitment(
         ) from e
 
 
+@router.get(
+    "/stream",
+    summary="Stream commitments",
+    description="Stream every matching commitment as newline-delimited JSON without paginating."
+)
+async def stream_commitments(
+    investor_id: Optional[str] = Query(
+        None, description="Filter by investor ID"),
+    asset_class_id: Optional[str] = Query(
+        None, description="Filter by asset class ID"),
+    currency: Optional[str] = Query(None, description="Filter by currency"),
+    repo: CommitmentRepository = Depends(get_commitment_repository)
+) -> StreamingResponse:
+    """
+    Stream commitments, encoding each batch as it is read from the cursor.
+    """
+    async def generate() -> AsyncIterator[bytes]:
+        try:
+            async for batch in repo.stream_commitments(
+                investor_id=investor_id,
+                asset_class_id=asset_class_id,
+                currency=currency
+            ):
+                yield encode_commitments_ndjson(batch)
+        except Exception as e:
+            # Headers are already sent; abort so the client sees a truncated body.
+            logger.error("Error streaming commitments: %s", e)
+            raise
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @router.get(
     "/{commitment_id}",
     response_model=CommitmentResponse,
@@ -88,7 +129,7 @@ async def create_commitment(
 async def get_commitment(
     commitment_id: str,
     repo: CommitmentRepository = Depends(get_commitment_repository)
-) -> CommitmentResponse:
+) -> Response:
     """Get a specific commitment by ID."""
     try:
         logger.info("Fetching commitment with ID: %s", commitment_id)
@@ -102,7 +143,8 @@ async def get_commitment(
                 detail=f"Commitment with ID {commitment_id} not found"
             )
 
-        return commitment
+        return Response(content=encode_commitment(commitment),
+                        media_type="application/json")
 
     except HTTPException:
         raise
@@ -134,7 +176,7 @@ async def list_commitments(
     sort_order: str = Query("desc", regex="^(asc|desc)$",
                             description="Sort order"),
     repo: CommitmentRepository = Depends(get_commitment_repository)
-) -> CommitmentListResponse:
+) -> Response:
     """Get a paginated list of commitments with filtering."""
     try:
         skip = (page - 1) * size
@@ -151,7 +193,9 @@ async def list_commitments(
             sort_order=sort_order
         )
 
-        return CommitmentListResponse(**result)
+        # The rows are trusted, so encode them directly; response_model only documents the shape.
+        return Response(content=encode_commitment_list(result),
+                        media_type="application/json")
 
     except Exception as e:
         logger.error("Error fetching commitments: %s", e)
@@ -163,6 +207,7 @@ async def list_commitments(
 
 @router.post(
     "/bulk-create",
+    response_model=list[CommitmentResponse],
     summary="Bulk create commitments",
     description="Create multiple commitments in a single request"
 )
@@ -170,7 +215,7 @@ async def bulk_create(
     commitments_data: list[CommitmentCreate] = Body(
         ..., description="List of commitments to create"),
     repo: CommitmentRepository = Depends(get_commitment_repository)
-) -> list[CommitmentResponse]:
+) -> Response:
     """
     Bulk create commitments for efficient ingestion.
 
@@ -183,7 +228,7 @@ async def bulk_create(
     """
     try:
         if not commitments_data:
-            return []
+            return Response(content=b"[]", media_type="application/json")
 
         logger.info("Bulk creating %d commitments", len(commitments_data))
 
@@ -192,7 +237,8 @@ async def bulk_create(
         logger.info("Successfully bulk created %d/%d commitments",
                     len(created_commitments), len(commitments_data))
 
-        return created_commitments
+        return Response(content=encode_commitments(created_commitments),
+                        media_type="application/json")
     except HTTPException:
         raise
     except Exception as e:
@@ -1,64 +1,149 @@
+import asyncio
 import logging
-from typing import Optional
+from typing import Iterable, List, Optional
 
+import msgspec
 import redis.asyncio as redis
 
-from app.config import settings
+from app.config import get_settings
 from app.models.commitment import CommitmentCreatedEvent
 
 logger = logging.getLogger(__name__)
 
+EVENT_CHANNEL = "investor_updates"
+
+_EVENT_ENCODER = msgspec.json.Encoder()
+
+
+def _encode_commitment_created(commitment_data: dict) -> bytes:
+    """Encode a commitment_created event without a validation pass."""
+    return _EVENT_ENCODER.encode(CommitmentCreatedEvent(
+        commitment_id=commitment_data["id"],
+        investor_id=commitment_data["investor_id"],
+        asset_class_id=commitment_data["asset_class_id"],
+        amount=commitment_data["amount"],
+        currency=commitment_data["currency"]
+    ))
+
 
 class EventPublisher:
     """
         Redis event publisher
+
+        Events are queued and a background task publishes them in pipelined
+        batches, so callers never wait on a Redis round trip.
     """
 
     def __init__(self) -> None:
-        self.redis_url = settings.redis_url
+        self._pool: Optional[redis.ConnectionPool] = None
         self._redis: Optional[redis.Redis] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        # Events dropped because the queue was full, e.g. during a broker outage.
+        self.dropped_events = 0
 
     async def connect(self):
-        """Connect to Redis."""
-        self._redis = redis.from_url(self.redis_url)
+        """Connect to Redis and start the background flusher."""
+        settings = get_settings()
+        self._pool = redis.ConnectionPool.from_url(
+            settings.redis_url, max_connections=settings.redis_max_connections)
+        self._redis = redis.Redis(connection_pool=self._pool)
 
         if self._redis is None:
             raise RuntimeError("Failed to create Redis connection")
 
         await self._redis.ping()
+        self._queue = asyncio.Queue(maxsize=settings.event_queue_max_size)
+        self._flush_task = asyncio.create_task(self._flush_loop())
         logger.info("Connected to Redis for event publishing")
 
     async def disconnect(self):
-        """Disconnect from Redis."""
+        """Publish any queued events, then disconnect from Redis."""
+        if self._flush_task:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout=5.0)
+            except asyncio.TimeoutError:
+                logger.warning("Dropped %d unpublished events on shutdown",
+                               self._queue.qsize())
+            self._flush_task.cancel()
+            self._flush_task = None
+            self._queue = None
+
         if self._redis:
             await self._redis.close()
+            self._redis = None
+
+        if self._pool:
+            await self._pool.disconnect()
+            self._pool = None
 
     async def publish_commitment_created(self, commitment_data: dict):
-        """Publish commitment created event."""
+        """Queue a commitment created event for publishing."""
+        self._enqueue([commitment_data])
+
+    async def publish_commitments_bulk(self, commitments_data: Iterable[dict]):
+        """
+        Queue commitment created events for a batch.
+
+        Each event is still its own message, so subscribers see the same stream
+        as with publish_commitment_created.
+        """
+        self._enqueue(commitments_data)
+
+    def _enqueue(self, commitments_data: Iterable[dict]):
+        """
+        Encode and queue events, dropping and counting any that don't fit.
+
+        The queue is bounded, so a broker outage costs events rather than memory.
+        """
+        if self._queue is None:
+            raise RuntimeError("No Redis connection found")
+
+        commitments = iter(commitments_data)
+        for commitment_data in commitments:
+            try:
+                self._queue.put_nowait(_encode_commitment_created(commitment_data))
+            except asyncio.QueueFull:
+                # Nothing drains the queue until we yield, so the rest won't fit either.
+                dropped = 1 + sum(1 for _ in commitments)
+                self.dropped_events += dropped
+                logger.warning("Event queue full; dropped %d events (%d since startup)",
+                               dropped, self.dropped_events)
+                return
+
+    async def _flush_loop(self):
+        """Drain the queue into pipelined PUBLISH batches until cancelled."""
+        settings = get_settings()
+        while True:
+            batch = [await self._queue.get()]
+
+            # Give a burst a moment to accumulate unless a full batch is already waiting.
+            if self._queue.qsize() < settings.event_batch_size - 1:
+                await asyncio.sleep(settings.event_flush_interval_seconds)
+            while len(batch) < settings.event_batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            try:
+                await self._publish_batch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _publish_batch(self, payloads: List[bytes]):
+        """Publish encoded events in one non-transactional pipeline."""
         try:
-            event = CommitmentCreatedEvent(
-                commitment_id=commitment_data["id"],
-                investor_id=commitment_data["investor_id"],
-                asset_class_id=commitment_data["asset_class_id"],
-                amount=commitment_data["amount"],
-                currency=commitment_data["currency"]
-            )
-
-            if self._redis is None:
-                raise RuntimeError("No Redis connection found")
-
-            await self._redis.publish(
-                "investor_updates",
-                event.model_dump_json()
-            )
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for payload in payloads:
+                    pipe.publish(EVENT_CHANNEL, payload)
+                await pipe.execute()
 
-            logger.info("Published commitment_created event for investor %s",
-                        event.investor_id)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Published %d commitment_created events", len(payloads))
 
         except (redis.RedisError, redis.ConnectionError, redis.TimeoutError) as e:
             logger.error("Redis error in event publisher: %s", e)
-        finally:
-            logger.info("Stopped publishing events")
+        except Exception as e:
+            logger.error("Unexpected error publishing events: %s", e)
 
 
 event_publisher = EventPublisher()
@@ -0,0 +1,51 @@
+import importlib
+from unittest.mock import AsyncMock
+
+import pytest
+import pytest_asyncio
+
+from app.config import get_settings
+from app.database import connection
+
+# app.repositories rebinds commitment_repository to its shared instance, so the
+# module itself is looked up by name.
+repository_module = importlib.import_module("app.repositories.commitment_repository")
+
+
+@pytest_asyncio.fixture
+async def database(tmp_path, monkeypatch):
+    """Connect the service to a fresh SQLite file for one test."""
+    monkeypatch.setattr(get_settings(), "database_url",
+                        f"sqlite:///{tmp_path / 'commitments.db'}")
+    connection.get_database_path.cache_clear()
+    await connection.connect_to_database()
+    yield connection.db
+    await connection.close_database_connection()
+    connection.get_database_path.cache_clear()
+
+
+@pytest.fixture
+def count_commitments(database):
+    """Count the stored commitments on a pooled reader."""
+    async def count():
+        async with connection.get_reader() as reader:
+            cursor = await reader.execute("SELECT COUNT(*) FROM commitments")
+            (total,) = await cursor.fetchone()
+        return total
+    return count
+
+
+@pytest.fixture
+def mock_event_publisher(monkeypatch):
+    """Replace the repository's event publisher with a mock."""
+    publisher = AsyncMock()
+    monkeypatch.setattr(repository_module, "event_publisher", publisher)
+    return publisher
+
+
+@pytest.fixture
+def commitment_repository(database, mock_event_publisher):
+    """Create a repository over the test database with an empty list cache."""
+    repository_module._list_cache.clear()
+    yield repository_module.CommitmentRepository()
+    repository_module._list_cache.clear()
@@ -0,0 +1,10 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+
+def make_commitment_row(investor_id="inv-1", asset_class_id="ac-1", amount=1000.0,
+                        currency="GBP", commitment_id=None):
+    """Build a row in the column order of INSERT_COMMITMENT_SQL."""
+    now = datetime.now(timezone.utc)
+    return (commitment_id or str(uuid4()), investor_id, asset_class_id,
+            amount, currency, now, now)
@@ -0,0 +1,93 @@
+import sqlite3
+from contextlib import AsyncExitStack
+
+import pytest
+
+from app.config import get_settings
+from app.database.connection import (INSERT_BATCH_ROWS,
+                                     bulk_insert_commitments, get_reader)
+from tests.factories.commitment import make_commitment_row
+
+
+class TestBulkInsertCommitments:
+    """Test cases for the chunked multi-row bulk insert."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("row_count, statement_count", [
+        (INSERT_BATCH_ROWS - 1, 1),
+        (INSERT_BATCH_ROWS, 1),
+        (INSERT_BATCH_ROWS + 1, 2),
+    ])
+    async def test_bulk_insert_chunk_boundaries(self, database, count_commitments, monkeypatch, row_count, statement_count):
+        """Test that every row is stored whatever the final chunk size."""
+        rows = [make_commitment_row(amount=float(i + 1)) for i in range(row_count)]
+
+        inserts = []
+        execute = database.writer.execute
+
+        async def counting_execute(sql, parameters=None):
+            if sql.lstrip().startswith("INSERT"):
+                inserts.append(len(parameters))
+            return await execute(sql, parameters)
+
+        monkeypatch.setattr(database.writer, "execute", counting_execute)
+
+        await bulk_insert_commitments(rows)
+
+        assert len(inserts) == statement_count
+        assert sum(inserts) == row_count * 7
+        assert await count_commitments() == row_count
+
+        async with get_reader() as reader:
+            cursor = await reader.execute("SELECT id, amount FROM commitments")
+            stored = dict(await cursor.fetchall())
+        assert stored == {row[0]: row[3] for row in rows}
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_rolls_back_when_a_later_chunk_fails(self, database, count_commitments):
+        """Test that a failing row discards the chunks already inserted."""
+        rows = [make_commitment_row() for _ in range(INSERT_BATCH_ROWS + 1)]
+        # The last row lands in the second statement and reuses the first row's id.
+        rows[-1] = make_commitment_row(commitment_id=rows[0][0])
+
+        with pytest.raises(sqlite3.IntegrityError):
+            await bulk_insert_commitments(rows)
+
+        assert await count_commitments() == 0
+
+        await bulk_insert_commitments([make_commitment_row()])
+        assert await count_commitments() == 1
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_rolls_back_when_a_row_in_the_batch_fails(self, database, count_commitments):
+        """Test that a bad row in a single statement stores nothing."""
+        rows = [make_commitment_row() for _ in range(3)]
+        rows[1] = make_commitment_row(investor_id=None)
+
+        with pytest.raises(sqlite3.IntegrityError):
+            await bulk_insert_commitments(rows)
+
+        assert await count_commitments() == 0
+
+
+class TestGetReader:
+    """Test cases for borrowing pooled reader connections."""
+
+    @pytest.mark.asyncio
+    async def test_get_reader_times_out_without_shrinking_the_pool(self, database, monkeypatch):
+        """Test that a timed-out wait leaves every connection in the pool."""
+        monkeypatch.setattr(get_settings(), "database_acquire_timeout_seconds", 0.01)
+        pool_size = database.read_pool.qsize()
+
+        async with AsyncExitStack() as stack:
+            for _ in range(pool_size):
+                await stack.enter_async_context(get_reader())
+
+            with pytest.raises(TimeoutError):
+                async with get_reader():
+                    pass
+
+        assert database.read_pool.qsize() == pool_size
+        async with get_reader() as reader:
+            cursor = await reader.execute("SELECT 1")
+            assert await cursor.fetchone() == (1,)
@@ -0,0 +1,36 @@
+import asyncio
+
+import pytest
+
+from app.services.event_publisher import EventPublisher
+
+
+def make_event_data(commitment_id):
+    """Build the commitment fields an event is encoded from."""
+    return {"id": commitment_id, "investor_id": "inv-1", "asset_class_id": "ac-1",
+            "amount": 1000.0, "currency": "GBP"}
+
+
+class TestEventPublisher:
+    """Test cases for the queued event publisher."""
+
+    @pytest.mark.asyncio
+    async def test_publish_drops_events_when_queue_is_full(self):
+        """Test that a full queue drops and counts events instead of growing."""
+        publisher = EventPublisher()
+        publisher._queue = asyncio.Queue(maxsize=2)
+
+        await publisher.publish_commitments_bulk(
+            [make_event_data(f"com-{i}") for i in range(3)])
+        await publisher.publish_commitment_created(make_event_data("com-3"))
+
+        assert publisher._queue.qsize() == 2
+        assert publisher.dropped_events == 2
+
+    @pytest.mark.asyncio
+    async def test_publish_without_connection_raises(self):
+        """Test that publishing before connect() is an error."""
+        publisher = EventPublisher()
+
+        with pytest.raises(RuntimeError):
+            await publisher.publish_commitment_created(make_event_data("com-1"))
@@ -0,0 +1,130 @@
+from itertools import product
+
+import pytest
+
+from app.config import get_settings
+from app.database.connection import bulk_insert_commitments, get_reader
+from app.models.commitment import CommitmentCreate
+from app.repositories.commitment_repository import _list_cache
+from tests.factories.commitment import make_commitment_row
+
+
+def _where(filters):
+    """Build the WHERE clause for the filters that are set."""
+    fields = [field for field, value in filters.items() if value is not None]
+    return " WHERE " + " AND ".join(f"{field} = ?" for field in fields) if fields else ""
+
+
+SEEDED_ROWS = [
+    make_commitment_row(investor_id, asset_class_id, amount, currency)
+    for investor_id, asset_class_id, currency, amount in (
+        ("inv-1", "ac-1", "GBP", 100.0),
+        ("inv-1", "ac-1", "USD", 250.0),
+        ("inv-1", "ac-2", "GBP", 75.5),
+        ("inv-2", "ac-1", "EUR", 1000.0),
+        ("inv-2", "ac-2", "USD", 40.0),
+        ("inv-2", "ac-3", "GBP", 12.25),
+        ("inv-3", "ac-3", "USD", 300.0),
+    )
+]
+
+
+class TestCommitmentTotals:
+    """Test cases for the totals derived from the asset class breakdown."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("investor_id, asset_class_id, currency", list(product(
+        (None, "inv-1", "inv-2", "inv-missing"),
+        (None, "ac-1", "ac-3", "ac-missing"),
+        (None, "GBP", "USD"),
+    )))
+    async def test_derived_totals_match_direct_aggregates(self, commitment_repository, investor_id, asset_class_id, currency):
+        """Test that total and total_amount equal a direct COUNT and SUM."""
+        await bulk_insert_commitments(SEEDED_ROWS)
+
+        result = await commitment_repository.get_commitments(
+            investor_id=investor_id, asset_class_id=asset_class_id, currency=currency)
+
+        # total counts every filter; total_amount ignores the asset class filter.
+        count_filters = {"investor_id": investor_id,
+                         "asset_class_id": asset_class_id, "currency": currency}
+        sum_filters = {"investor_id": investor_id, "currency": currency}
+        async with get_reader() as reader:
+            cursor = await reader.execute(
+                "SELECT COUNT(*) FROM commitments" + _where(count_filters),
+                [value for value in count_filters.values() if value is not None])
+            (expected_total,) = await cursor.fetchone()
+            cursor = await reader.execute(
+                "SELECT COALESCE(SUM(amount), 0) FROM commitments" + _where(sum_filters),
+                [value for value in sum_filters.values() if value is not None])
+            (expected_amount,) = await cursor.fetchone()
+
+        assert result["total"] == expected_total
+        assert result["total_amount"] == pytest.approx(expected_amount)
+        assert result["total_pages"] == (expected_total + 99) // 100
+
+
+class TestCommitmentListCache:
+    """Test cases for the cached commitment list pages."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_list_is_served_from_cache(self, commitment_repository):
+        """Test that the same query returns the cached page."""
+        await bulk_insert_commitments([make_commitment_row() for _ in range(2)])
+
+        first = await commitment_repository.get_commitments()
+        second = await commitment_repository.get_commitments()
+
+        assert second is first
+        assert first["total"] == 2
+
+    @pytest.mark.asyncio
+    async def test_create_invalidates_cached_pages(self, commitment_repository):
+        """Test that a created commitment shows up on the next list."""
+        await bulk_insert_commitments([make_commitment_row(amount=100.0)])
+        before = await commitment_repository.get_commitments()
+
+        created = await commitment_repository.create_commitment(CommitmentCreate(
+            investor_id="inv-1", asset_class_id="ac-1", amount=50.0))
+        after = await commitment_repository.get_commitments()
+
+        assert created is not None
+        assert before["total"] == 1
+        assert after["total"] == 2
+        assert after["total_amount"] == 150.0
+        assert created.id in {commitment.id for commitment in after["commitments"]}
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_invalidates_cached_pages(self, commitment_repository):
+        """Test that bulk created commitments show up on every cached page."""
+        await bulk_insert_commitments([make_commitment_row()])
+        first_page = await commitment_repository.get_commitments(skip=0, limit=1)
+        filtered = await commitment_repository.get_commitments(investor_id="inv-2")
+
+        created = await commitment_repository.bulk_create_commitments([
+            CommitmentCreate(investor_id="inv-2", asset_class_id="ac-2", amount=10.0)
+            for _ in range(3)
+        ])
+
+        assert len(created) == 3
+        assert first_page["total"] == 1
+        assert filtered["total"] == 0
+        assert (await commitment_repository.get_commitments(skip=0, limit=1))["total"] == 4
+        assert (await commitment_repository.get_commitments(investor_id="inv-2"))["total"] == 3
+
+    @pytest.mark.asyncio
+    async def test_list_cache_evicts_least_recently_used(self, commitment_repository, monkeypatch):
+        """Test that the cache keeps at most list_cache_size pages."""
+        monkeypatch.setattr(get_settings(), "list_cache_size", 2)
+        await bulk_insert_commitments([make_commitment_row() for _ in range(3)])
+
+        page_a = await commitment_repository.get_commitments(skip=0, limit=1)
+        page_b = await commitment_repository.get_commitments(skip=1, limit=1)
+        # Touch page A so page B becomes the least recently used.
+        assert await commitment_repository.get_commitments(skip=0, limit=1) is page_a
+        page_c = await commitment_repository.get_commitments(skip=2, limit=1)
+
+        assert len(_list_cache) == 2
+        assert await commitment_repository.get_commitments(skip=0, limit=1) is page_a
+        assert await commitment_repository.get_commitments(skip=2, limit=1) is page_c
+        assert await commitment_repository.get_commitments(skip=1, limit=1) is not page_b
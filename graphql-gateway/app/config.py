@@ -27,6 +27,10 @@ class Settings(BaseSettings):
     asset_class_service_url: str = "http://localhost:8001"
 
     http_timeout_seconds: float = 30.0
+    http_max_connections: int = 200
+    http_max_keepalive_connections: int = 100
+    upstream_initial_concurrency: int = 8
+    upstream_max_concurrency: int = 128
     max_retries: int = 3
     retry_delay_seconds: float = 1.0
 
@@ -0,0 +1,10 @@
+"""
+Request-scoped DataLoaders for batching upstream lookups.
+"""
+
+from .asset_class_loader import AssetClassLoader, create_asset_class_loader
+from .investor_loader import InvestorLoader, create_investor_loader
+from .request_cache import RequestCache, memoize
+
+__all__ = ["AssetClassLoader", "create_asset_class_loader", "InvestorLoader",
+           "create_investor_loader", "RequestCache", "memoize"]
@@ -0,0 +1,25 @@
+"""
+DataLoader that batches asset class lookups by ID.
+"""
+
+from typing import List, Optional
+
+from strawberry.dataloader import DataLoader
+
+from app.services.asset_class_service import AssetClassClient, AssetClassData
+
+AssetClassLoader = DataLoader[str, Optional[AssetClassData]]
+
+
+def create_asset_class_loader(client: AssetClassClient) -> AssetClassLoader:
+    """
+    Create a loader that coalesces .load(id) calls into one bulk request.
+
+    Build one per GraphQL request so its cache never outlives the operation.
+    """
+    async def load_asset_classes(asset_class_ids: List[str]) -> List[Optional[AssetClassData]]:
+        asset_classes = await client.get_asset_classes(asset_class_ids)
+        by_id = {asset_class["id"]: asset_class for asset_class in asset_classes}
+        return [by_id.get(asset_class_id) for asset_class_id in asset_class_ids]
+
+    return DataLoader(load_fn=load_asset_classes)
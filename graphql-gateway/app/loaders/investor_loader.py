@@ -0,0 +1,25 @@
+"""
+DataLoader that batches investor lookups by ID.
+"""
+
+from typing import List, Optional
+
+from strawberry.dataloader import DataLoader
+
+from app.services.investor_service import InvestorClient, InvestorData
+
+InvestorLoader = DataLoader[str, Optional[InvestorData]]
+
+
+def create_investor_loader(client: InvestorClient) -> InvestorLoader:
+    """
+    Create a loader that coalesces .load(id) calls into one batch request.
+
+    Build one per GraphQL request so its cache never outlives the operation.
+    """
+    async def load_investors(investor_ids: List[str]) -> List[Optional[InvestorData]]:
+        investors = await client.get_investors(investor_ids)
+        by_id = {investor["id"]: investor for investor in investors}
+        return [by_id.get(investor_id) for investor_id in investor_ids]
+
+    return DataLoader(load_fn=load_investors)
@@ -0,0 +1,24 @@
+"""
+Request-scoped memoization for upstream calls.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+RequestCache = Dict[Hashable, "asyncio.Future[Any]"]
+
+
+def memoize(cache: RequestCache, key: Hashable,
+            fetch: Callable[[], Awaitable[T]]) -> "asyncio.Future[T]":
+    """
+    Return the in-flight or finished call for key, starting it only on first use.
+
+    Concurrent awaits of the same key share one upstream call.
+    """
+    future = cache.get(key)
+    if future is None:
+        future = asyncio.ensure_future(fetch())
+        cache[key] = future
+    return future
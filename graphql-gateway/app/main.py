@@ -5,13 +5,15 @@ GraphQL Gateway for Investment Platform.
 import logging
 from contextlib import asynccontextmanager
 
+import orjson
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from strawberry.fastapi import GraphQLRouter
 
+from app.loaders import create_asset_class_loader, create_investor_loader
 from app.schema import schema
-from app.services import (close_asset_class_client, close_commitment_client,
-                          close_investor_client)
+from app.services import (close_shared_http_client, get_asset_class_client,
+                          get_investor_client)
 
 logger = logging.getLogger(__name__)
 
@@ -19,9 +21,7 @@ logger = logging.getLogger(__name__)
 async def close_all_clients():
     """Close all HTTP clients to clean up resources."""
     try:
-        await close_investor_client()
-        await close_commitment_client()
-        await close_asset_class_client()
+        await close_shared_http_client()
 
         logger.info("All HTTP clients closed successfully")
 
@@ -57,7 +57,24 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-graphql_app = GraphQLRouter(schema)
+
+async def get_context() -> dict:
+    """Build the per-request GraphQL context with fresh DataLoaders and caches."""
+    return {
+        "asset_class_loader": create_asset_class_loader(get_asset_class_client()),
+        "investor_loader": create_investor_loader(get_investor_client()),
+        "request_cache": {}
+    }
+
+
+class ORJSONGraphQLRouter(GraphQLRouter):
+    """GraphQL router that encodes results with orjson instead of stdlib json."""
+
+    def encode_json(self, data: object) -> bytes:
+        return orjson.dumps(data)
+
+
+graphql_app = ORJSONGraphQLRouter(schema, context_getter=get_context)
 app.include_router(graphql_app, prefix="/graphql")
 
 
@@ -1,4 +1,5 @@
 import strawberry
+from strawberry.extensions import ParserCache, ValidationCache
 
 from .commitments import CommitmentQueries
 from .investors import InvestorQueries
@@ -15,4 +16,14 @@ class Query(InvestorQueries, CommitmentQueries):
     """
 
 
-schema = strawberry.Schema(query=Query)
+# Clients send the same few documents, so parse and validation results are
+# reused across requests instead of recomputed for each one.
+DOCUMENT_CACHE_SIZE = 256
+
+schema = strawberry.Schema(
+    query=Query,
+    extensions=[
+        ParserCache(maxsize=DOCUMENT_CACHE_SIZE),
+        ValidationCache(maxsize=DOCUMENT_CACHE_SIZE),
+    ]
+)
@@ -3,13 +3,15 @@ Updated GraphQL Schema with Commitment Breakdown Focus.
 """
 import asyncio
 import logging
-from typing import List, Optional
+from operator import itemgetter
+from typing import Dict, List, Optional
 
 import strawberry
 
-from app.services import (get_asset_class_client, get_commitment_client,
-                          get_investor_client)
-from app.services.commitment_service import CommitmentData
+from app.loaders import AssetClassLoader, InvestorLoader, RequestCache, memoize
+from app.services import get_commitment_client
+from app.services.commitment_service import (CommitmentData,
+                                             CommitmentListResponse)
 from app.utils.validator import safe_response
 
 logger = logging.getLogger(__name__)
@@ -18,6 +20,9 @@ logger = logging.getLogger(__name__)
 @strawberry.type
 class AssetSummary:
     """Summary of an asset class used in commitments."""
+    __slots__ = ("id", "name", "total_commitment_amount", "commitment_count",
+                 "percentage_of_total")
+
     id: str
     name: str
     total_commitment_amount: float
@@ -28,6 +33,10 @@ class AssetSummary:
 @strawberry.type
 class CommitmentDetail:
     """Individual commitment with asset class details."""
+    # Slotted: a breakdown builds one of these per commitment.
+    __slots__ = ("id", "asset_class_id", "name", "amount", "currency",
+                 "percentage", "created_at")
+
     id: str
     asset_class_id: str
     name: str
@@ -47,6 +56,39 @@ class CommitmentBreakdown:
     commitments: List[CommitmentDetail]
 
 
+async def _load_asset_class_names(
+    loader: AssetClassLoader,
+    commitments_response: Optional[CommitmentListResponse]
+) -> Dict[str, str]:
+    """Resolve names for every asset class referenced by a commitments response."""
+    if not commitments_response:
+        return {}
+
+    asset_class_ids = list(dict.fromkeys(
+        [c["asset_class_id"] for c in commitments_response.get("commitments", [])] +
+        [b["asset_class_id"]
+            for b in commitments_response.get("asset_breakdowns", [])]
+    ))
+    if not asset_class_ids:
+        return {}
+
+    # A failed lookup only costs the names; the breakdown still renders.
+    try:
+        asset_classes = await loader.load_many(asset_class_ids)
+    except Exception as e:
+        logger.error("asset_class service error: %s", e)
+        return {}
+    return {ac["id"]: ac["name"] for ac in asset_classes if ac}
+
+
+def _asset_class_name(asset_class_names: Dict[str, str], asset_class_id: str) -> str:
+    """Look up an asset class name, only building the fallback on a miss."""
+    name = asset_class_names.get(asset_class_id)
+    if name is None:
+        return f"Unknown Asset Class ({asset_class_id})"
+    return name
+
+
 @strawberry.type
 class CommitmentQueries:
     """Commitment-related GraphQL queries."""
@@ -54,6 +96,7 @@ class CommitmentQueries:
     @strawberry.field
     async def commitment_breakdown(
         self,
+        info: strawberry.Info,
         investor_id: str,
         asset_class_id: Optional[str] = None
     ) -> Optional[CommitmentBreakdown]:
@@ -64,6 +107,7 @@ class CommitmentQueries:
         Can optionally filter by asset class.
 
         Args:
+            info: GraphQL resolver info carrying the request-scoped loaders
             investor_id: Investor identifier
             asset_class_id: Optional asset class filter
 
@@ -71,29 +115,43 @@ class CommitmentQueries:
             CommitmentBreakdown with detailed commitment list and asset summaries
         """
         try:
-            logger.info(
+            logger.debug(
                 "Fetching commitment breakdown for investor: %s, asset_class: %s",
                 investor_id, asset_class_id or "all"
             )
 
             commitment_client = get_commitment_client()
-            asset_class_client = get_asset_class_client()
-            investor_client = get_investor_client()
 
             commitment_params = {"investor_id": investor_id}
             if asset_class_id:
                 commitment_params["asset_class_id"] = asset_class_id
 
+            asset_class_loader: AssetClassLoader = info.context["asset_class_loader"]
+            # Breakdowns for several investors in one operation share a batch request.
+            investor_loader: InvestorLoader = info.context["investor_loader"]
+            # Aliased fields asking for the same data share one upstream call per request.
+            request_cache: RequestCache = info.context["request_cache"]
+
+            async def fetch_commitments_with_names():
+                response = await memoize(
+                    request_cache,
+                    ("commitments", investor_id, asset_class_id),
+                    lambda: commitment_client.get_commitments(**commitment_params)
+                )
+                return response, await _load_asset_class_names(asset_class_loader, response)
+
+            # Asset class names only depend on the commitments, so that chain runs
+            # alongside the investor fetch instead of after it.
             results = await asyncio.gather(
-                commitment_client.get_commitments(**commitment_params),
-                investor_client.get_investor(investor_id),
+                fetch_commitments_with_names(),
+                investor_loader.load(investor_id),
                 return_exceptions=True
             )
 
             commitments_result, investor_result = results
 
-            commitments_response = safe_response(
-                commitments_result, "commitment", None)
+            commitments_response, asset_class_names = safe_response(
+                commitments_result, "commitment", (None, {}))
             investor_data = safe_response(investor_result, "investor", None)
 
             if not investor_data:
@@ -128,41 +186,27 @@ class CommitmentQueries:
                     assets=[]
                 )
 
-            asset_class_result = await asset_class_client.get_all_asset_classes()
-
-            asset_class_names = {
-                ac["id"]: ac["name"] for ac in asset_class_result
-            }
-
-            commitment_details = []
-            for commitment in commitments_data:
-                asset_class_name = asset_class_names.get(
-                    commitment["asset_class_id"],
-                    f"Unknown Asset Class ({commitment['asset_class_id']})"
-                )
-
-                percentage = (
-                    commitment["amount"] / total_amount * 100) if total_amount > 0 else 0
-
-                detail = CommitmentDetail(
+            # Sort the plain dicts once, then build the details in a single pass;
+            # sorted() leaves the upstream response untouched.
+            percent_scale = (100.0 / total_amount) if total_amount > 0 else 0.0
+            commitment_details = [
+                CommitmentDetail(
                     id=commitment["id"],
                     asset_class_id=commitment["asset_class_id"],
-                    name=asset_class_name,
+                    name=_asset_class_name(
+                        asset_class_names, commitment["asset_class_id"]),
                     amount=commitment["amount"],
                     currency=commitment["currency"],
-                    percentage=round(percentage, 2),
+                    percentage=round(commitment["amount"] * percent_scale, 2),
                     created_at=commitment["created_at"]
                 )
-                commitment_details.append(detail)
-
-            commitment_details.sort(key=lambda x: x.amount, reverse=True)
+                for commitment in sorted(commitments_data, key=itemgetter("amount"), reverse=True)
+            ]
 
             enhanced_assets = []
             for asset_breakdown in asset_breakdowns_data:
-                asset_name = asset_class_names.get(
-                    asset_breakdown["asset_class_id"],
-                    f"Unknown Asset Class ({asset_breakdown['asset_class_id']})"
-                )
+                asset_name = _asset_class_name(
+                    asset_class_names, asset_breakdown["asset_class_id"])
 
                 asset_summary = AssetSummary(
                     id=asset_breakdown["asset_class_id"],
@@ -17,6 +17,11 @@ logger = logging.getLogger(__name__)
 @strawberry.type
 class InvestorDetail:
     """Basic investor information for GraphQL responses."""
+    # Slotted: a page builds one of these per investor.
+    __slots__ = ("id", "name", "investor_type", "country", "date_added",
+                 "commitment_count", "total_commitment_amount", "created_at",
+                 "updated_at")
+
     id: str
     name: str
     investor_type: str
@@ -49,7 +54,7 @@ class InvestorQueries:
         Get paginated list of all investors with metadata.
         """
         try:
-            logger.info("Fetching investors list (page: %d, size: %d)",
+            logger.debug("Fetching investors list (page: %d, size: %d)",
                         page, size)
 
             investor_client = get_investor_client()
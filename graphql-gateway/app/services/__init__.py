@@ -2,10 +2,10 @@
 Router module initialization.
 """
 
-from .asset_class_service import (close_asset_class_client,
-                                  get_asset_class_client)
-from .commitment_service import close_commitment_client, get_commitment_client
-from .investor_service import close_investor_client, get_investor_client
+from .asset_class_service import get_asset_class_client
+from .commitment_service import get_commitment_client
+from .http_client import close_shared_http_client, get_shared_http_client
+from .investor_service import get_investor_client
 
-__all__ = ["get_asset_class_client", "close_asset_class_client",
-           "get_investor_client", "close_commitment_client", "get_commitment_client", "close_investor_client"]
+__all__ = ["get_asset_class_client", "get_investor_client", "get_commitment_client",
+           "get_shared_http_client", "close_shared_http_client"]
@@ -5,13 +5,17 @@ Provides clean interfaces for GraphQL resolvers to fetch data from
 the investor, commitment, and asset class services.
 """
 
+import asyncio
 import logging
+import time
 from functools import lru_cache
-from typing import List, Optional, TypedDict
+from typing import Dict, List, Optional, Tuple, TypedDict
 
 import httpx
 
 from app.config import settings
+from app.services.http_client import decode_json, get_shared_http_client
+from app.utils.concurrency import AdaptiveConcurrencyLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -26,50 +30,126 @@ class AssetClassData(TypedDict):
     updated_at: str
 
 
+# The asset class service accepts at most 100 ids per bulk request.
+ASSET_CLASS_BULK_LIMIT = 100
+
+
 class AssetClassClient:
     """HTTP client for the Asset Class Service."""
 
     def __init__(self):
         """Initialize the asset class service client."""
         self.base_url = settings.asset_class_service_url
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.limiter = AdaptiveConcurrencyLimiter(
+            "asset-class-service", settings.upstream_initial_concurrency,
+            settings.upstream_max_concurrency)
+        # Asset classes change rarely, so lookups by id are cached for
+        # cache_ttl_seconds: id -> (expires_at, asset class).
+        self._cache: Dict[str, Tuple[float, AssetClassData]] = {}
+        # Fetches in progress: id -> future resolving to the asset class or None.
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The shared HTTP client, looked up per call so a restarted app never holds a closed one."""
+        return get_shared_http_client()
+
+    def _split_cached(self, asset_class_ids: List[str]) -> Tuple[List[AssetClassData], List[str]]:
+        """
+        Split IDs into live cached asset classes and IDs that must be fetched.
+        """
+        now = time.monotonic()
+        cached: List[AssetClassData] = []
+        missing: List[str] = []
+        for asset_class_id in asset_class_ids:
+            entry = self._cache.get(asset_class_id)
+            if entry is not None and entry[0] > now:
+                cached.append(entry[1])
+            else:
+                missing.append(asset_class_id)
+        return cached, missing
+
+    async def get_asset_classes(self, asset_class_ids: List[str]) -> List[AssetClassData]:
+        """
+        Fetch asset classes by IDs, serving cached ones and fetching the rest.
+
+        Concurrent misses for the same ID share one fetch; misses for other IDs
+        are fetched independently rather than queued behind it.
+        """
+        if not asset_class_ids:
+            return []
 
-    async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        asset_classes, missing = self._split_cached(asset_class_ids)
+        if not missing:
+            return asset_classes
+
+        # Checking and registering futures never awaits, so it needs no lock.
+        loop = asyncio.get_running_loop()
+        waiting: List[asyncio.Future] = []
+        to_fetch: List[str] = []
+        for asset_class_id in dict.fromkeys(missing):
+            future = self._in_flight.get(asset_class_id)
+            if future is None:
+                future = loop.create_future()
+                self._in_flight[asset_class_id] = future
+                to_fetch.append(asset_class_id)
+            waiting.append(future)
+
+        fetched: Dict[str, AssetClassData] = {}
+        try:
+            if to_fetch:
+                expires_at = time.monotonic() + settings.cache_ttl_seconds
+                for asset_class in await self._fetch_asset_classes(to_fetch):
+                    self._cache[asset_class["id"]] = (expires_at, asset_class)
+                    fetched[asset_class["id"]] = asset_class
+        finally:
+            for asset_class_id in to_fetch:
+                self._in_flight.pop(asset_class_id).set_result(
+                    fetched.get(asset_class_id))
+
+        # Shielded so a cancelled caller doesn't cancel fetches others await.
+        results = await asyncio.gather(*(asyncio.shield(future) for future in waiting))
+        asset_classes.extend(asset_class for asset_class in results if asset_class)
+        return asset_classes
+
+    async def _fetch_asset_classes(self, asset_class_ids: List[str]) -> List[AssetClassData]:
+        """
+        Fetch asset classes by IDs, one bulk request per 100 IDs.
+        """
+        batches = [asset_class_ids[i:i + ASSET_CLASS_BULK_LIMIT]
+                   for i in range(0, len(asset_class_ids), ASSET_CLASS_BULK_LIMIT)]
+        results = await asyncio.gather(*(self._get_asset_class_batch(batch)
+                                         for batch in batches))
+        return [asset_class for batch in results for asset_class in batch]
 
-    async def get_all_asset_classes(self) -> List[AssetClassData]:
+    async def _get_asset_class_batch(self, asset_class_ids: List[str]) -> List[AssetClassData]:
         """
-        Fetch multiple asset classes by IDs in a single batch request.
+        Fetch one batch of asset classes from the bulk endpoint.
         """
         try:
-            logger.debug(
-                "Fetching all asset classes from asset class service")
+            logger.debug("Fetching %d asset classes by id", len(asset_class_ids))
 
-            url = f"{self.base_url}/api/asset-classes/"
+            url = f"{self.base_url}/api/asset-classes/bulk"
 
-            response = await self.client.get(url)
+            response = await self.limiter.run(
+                lambda: self.client.post(url, json=asset_class_ids))
 
             if response.status_code == 200:
-                data: list[AssetClassData] = response.json()
+                data: list[AssetClassData] = await decode_json(response)
                 return data
-            elif response.status_code == 404:
-                logger.debug("Asset classes couldnt be fetched")
-                return []
             else:
-                logger.error("Error fetching asset classes: HTTP %d - %s",
+                logger.error("Error fetching asset classes by id: HTTP %d - %s",
                              response.status_code, response.text)
                 return []
 
         except httpx.RequestError as e:
-            logger.error("Network error fetching asset class: %s",
-                         e)
+            logger.error("Network error fetching asset classes by id: %s", e)
             return []
         except Exception as e:
-            logger.error("Unexpected error fetching asset class: %s",
-                         e)
+            logger.error("Unexpected error fetching asset classes by id: %s", e)
             return []
 
+
 @lru_cache(maxsize=1)
 def get_asset_class_client() -> AssetClassClient:
     """
@@ -77,9 +157,3 @@ def get_asset_class_client() -> AssetClassClient:
     """
     return AssetClassClient()
 
-
-async def close_asset_class_client():
-    """Close the cached asset class client instance and clear cache."""
-    client = get_asset_class_client()
-    await client.close()
-    get_asset_class_client.cache_clear()
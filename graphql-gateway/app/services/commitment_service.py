@@ -12,6 +12,9 @@ from typing import List, Optional, TypedDict
 import httpx
 
 from app.config import settings
+from app.services.http_client import decode_json, get_shared_http_client
+from app.utils.concurrency import AdaptiveConcurrencyLimiter
+from app.utils.retry import retry_request
 
 logger = logging.getLogger(__name__)
 
@@ -54,11 +57,14 @@ class CommitmentClient:
     def __init__(self):
         """Initialize the commitment service client."""
         self.base_url = settings.commitment_service_url
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.limiter = AdaptiveConcurrencyLimiter(
+            "commitment-service", settings.upstream_initial_concurrency,
+            settings.upstream_max_concurrency)
 
-    async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The shared HTTP client, looked up per call so a restarted app never holds a closed one."""
+        return get_shared_http_client()
 
     async def get_commitments(
         self,
@@ -85,10 +91,11 @@ class CommitmentClient:
             if asset_class_id:
                 params["asset_class_id"] = asset_class_id
 
-            response = await self.client.get(url, params=params)
+            response = await retry_request(
+                lambda: self.client.get(url, params=params), limiter=self.limiter)
 
             if response.status_code == 200:
-                data = response.json()
+                data = await decode_json(response)
                 commitments = data.get("commitments", [])
                 logger.debug(
                     "Successfully fetched %d commitments for investor %s",
@@ -136,9 +143,3 @@ def get_commitment_client() -> CommitmentClient:
     """
     return CommitmentClient()
 
-
-async def close_commitment_client():
-    """Close the cached commitment client instance and clear the cache."""
-    client = get_commitment_client()
-    await client.close()
-    get_commitment_client.cache_clear()
@@ -0,0 +1,51 @@
+"""
+Shared HTTP client for calls to the upstream microservices.
+"""
+
+import asyncio
+import logging
+from functools import lru_cache
+from typing import Any
+
+import httpx
+import orjson
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Bodies at least this large are decoded on a worker thread.
+DECODE_OFFLOAD_THRESHOLD_BYTES = 32_000
+
+
+@lru_cache(maxsize=1)
+def get_shared_http_client() -> httpx.AsyncClient:
+    """
+    Get the pooled HTTP client shared by every service client.
+
+    One pool keeps keep-alive connections to each upstream warm across resolvers.
+    """
+    return httpx.AsyncClient(
+        timeout=settings.http_timeout_seconds,
+        limits=httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections
+        )
+    )
+
+
+async def close_shared_http_client():
+    """Close the shared HTTP client and clear the cache."""
+    client = get_shared_http_client()
+    await client.aclose()
+    get_shared_http_client.cache_clear()
+
+
+async def decode_json(response: httpx.Response) -> Any:
+    """
+    Decode a JSON response body, moving large bodies off the event loop.
+    """
+    body = response.content
+    if len(body) < DECODE_OFFLOAD_THRESHOLD_BYTES:
+        return orjson.loads(body)
+    return await asyncio.to_thread(orjson.loads, body)
@@ -5,16 +5,22 @@ Provides clean interfaces for GraphQL resolvers to fetch data from
 the investor, commitment, and asset class services.
 """
 
+import asyncio
 import logging
 from functools import lru_cache
-from typing import Optional, TypedDict
+from typing import List, Optional, TypedDict
 
 import httpx
 
 from app.config import settings
+from app.services.http_client import decode_json, get_shared_http_client
+from app.utils.concurrency import AdaptiveConcurrencyLimiter
+from app.utils.retry import retry_request
 
 logger = logging.getLogger(__name__)
 
+INVESTOR_BATCH_LIMIT = 100
+
 
 class InvestorData(TypedDict):
     """Type definition for investor data from the investor service."""
@@ -45,11 +51,14 @@ class InvestorClient:
     def __init__(self):
         """Initialize the investor service client."""
         self.base_url = settings.investor_service_url
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.limiter = AdaptiveConcurrencyLimiter(
+            "investor-service", settings.upstream_initial_concurrency,
+            settings.upstream_max_concurrency)
 
-    async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The shared HTTP client, looked up per call so a restarted app never holds a closed one."""
+        return get_shared_http_client()
 
     async def get_all_investors(self, page: int, size: int) -> Optional[InvestorListResponse]:
         """
@@ -67,10 +76,11 @@ class InvestorClient:
                 "size": size
             }
 
-            response = await self.client.get(url, params=params)
+            response = await retry_request(
+                lambda: self.client.get(url, params=params), limiter=self.limiter)
 
             if response.status_code == 200:
-                data = response.json()
+                data = await decode_json(response)
                 logger.debug("Successfully fetched %d investors (total: %d)",
                              len(data.get("investors", [])), data.get("total", 0))
                 return data
@@ -101,10 +111,11 @@ class InvestorClient:
                 "Fetching investor %s from investor service", investor_id)
 
             url = f"{self.base_url}/api/investors/{investor_id}"
-            response = await self.client.get(url)
+            response = await retry_request(
+                lambda: self.client.get(url), limiter=self.limiter)
 
             if response.status_code == 200:
-                investor_data = response.json()
+                investor_data = await decode_json(response)
                 logger.debug("Successfully fetched investor: %s",
                              investor_data.get("name"))
                 return investor_data
@@ -125,6 +136,48 @@ class InvestorClient:
                 "Unexpected error fetching investor %s: %s", investor_id, e)
             return None
 
+    async def get_investors(self, investor_ids: List[str]) -> List[InvestorData]:
+        """
+        Fetch investors by IDs, one batch request per 100 IDs.
+
+        Missing investors are left out of the result.
+        """
+        if not investor_ids:
+            return []
+
+        batches = [investor_ids[i:i + INVESTOR_BATCH_LIMIT]
+                   for i in range(0, len(investor_ids), INVESTOR_BATCH_LIMIT)]
+        results = await asyncio.gather(*(self._get_investor_batch(batch)
+                                         for batch in batches))
+        return [investor for batch in results for investor in batch]
+
+    async def _get_investor_batch(self, investor_ids: List[str]) -> List[InvestorData]:
+        """
+        Fetch one batch of investors from the batch endpoint.
+        """
+        try:
+            logger.debug("Fetching %d investors by id", len(investor_ids))
+
+            url = f"{self.base_url}/api/investors/batch"
+
+            response = await self.limiter.run(
+                lambda: self.client.post(url, json=investor_ids))
+
+            if response.status_code == 200:
+                data: list[InvestorData] = await decode_json(response)
+                return data
+            else:
+                logger.error("Error fetching investors by id: HTTP %d - %s",
+                             response.status_code, response.text)
+                return []
+
+        except httpx.RequestError as e:
+            logger.error("Network error fetching investors by id: %s", e)
+            return []
+        except Exception as e:
+            logger.error("Unexpected error fetching investors by id: %s", e)
+            return []
+
 
 @lru_cache(maxsize=1)
 def get_investor_client() -> InvestorClient:
@@ -136,9 +189,3 @@ def get_investor_client() -> InvestorClient:
     """
     return InvestorClient()
 
-
-async def close_investor_client():
-    """Close the cached investor client instance and clear the cache."""
-    client = get_investor_client()
-    await client.close()
-    get_investor_client.cache_clear()
@@ -0,0 +1,65 @@
+"""
+Adaptive concurrency limiting for upstream requests.
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+OVERLOAD_STATUS_CODES = frozenset({429, 503})
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD limit on in-flight requests to one upstream service.
+
+    The limit grows by roughly one per window of successful requests and
+    halves when the upstream signals overload (429/503 or a timeout), so a
+    struggling service sees less traffic instead of a pile of timeouts.
+    """
+
+    def __init__(self, name: str, initial_concurrency: int, max_concurrency: int,
+                 min_concurrency: int = 1):
+        self.name = name
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.limit = float(initial_concurrency)
+        self.in_flight = 0
+        self._condition = asyncio.Condition()
+
+    async def run(self, send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        """
+        Send a request once the limit allows, adjusting the limit from its outcome.
+        """
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+
+        # None leaves the limit alone, e.g. for connection errors or cancellation.
+        overloaded: Optional[bool] = None
+        try:
+            response = await send()
+            overloaded = response.status_code in OVERLOAD_STATUS_CODES
+            return response
+        except httpx.TimeoutException:
+            overloaded = True
+            raise
+        finally:
+            async with self._condition:
+                self.in_flight -= 1
+                if overloaded is not None:
+                    self._adjust(overloaded)
+                self._condition.notify_all()
+
+    def _adjust(self, overloaded: bool) -> None:
+        """Halve the limit on overload, otherwise grow it additively."""
+        if overloaded:
+            self.limit = max(self.min_concurrency, self.limit / 2)
+            logger.warning("%s overloaded, concurrency limit lowered to %d",
+                           self.name, int(self.limit))
+        else:
+            self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
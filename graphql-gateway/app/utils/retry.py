@@ -0,0 +1,63 @@
+"""
+Retry helper for idempotent upstream requests.
+"""
+
+import asyncio
+import logging
+import random
+from typing import Awaitable, Callable, Optional
+
+import httpx
+
+from app.config import settings
+from app.utils.concurrency import AdaptiveConcurrencyLimiter
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+async def retry_request(
+    send: Callable[[], Awaitable[httpx.Response]],
+    *,
+    limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+    retries: Optional[int] = None,
+    base_delay: Optional[float] = None
+) -> httpx.Response:
+    """
+    Send an idempotent request, retrying transient failures with backoff.
+
+    Network errors and 429/502/503/504 responses are retried after
+    base_delay * 2**attempt plus up to base_delay of jitter. The last
+    response is returned, or the last network error raised, once the
+    retries are used up.
+
+    Args:
+        send: Callable issuing the request
+        limiter: Upstream concurrency limiter each attempt goes through
+        retries: Retries after the first attempt (defaults to settings.max_retries)
+        base_delay: Backoff base in seconds (defaults to settings.retry_delay_seconds)
+
+    Returns:
+        The upstream response
+    """
+    retries = settings.max_retries if retries is None else retries
+    base_delay = settings.retry_delay_seconds if base_delay is None else base_delay
+
+    attempt = 0
+    while True:
+        try:
+            response = await (limiter.run(send) if limiter else send())
+            if response.status_code not in RETRYABLE_STATUS_CODES or attempt >= retries:
+                return response
+            reason = f"HTTP {response.status_code}"
+        except httpx.RequestError as e:
+            if attempt >= retries:
+                raise
+            reason = str(e)
+
+        delay = base_delay * 2 ** attempt + random.uniform(0, base_delay)
+        attempt += 1
+        logger.warning("Upstream request failed (%s), retry %d/%d in %.2fs",
+                       reason, attempt, retries, delay)
+        await asyncio.sleep(delay)
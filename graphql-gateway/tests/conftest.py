@@ -1,61 +1,211 @@
-from unittest.mock import AsyncMock, MagicMock
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any, Optional
 
 import httpx
+import orjson
 import pytest
-
+from fastapi.testclient import TestClient
+from pytest_asyncio import is_async_test
+
+from app.loaders import create_asset_class_loader, create_investor_loader
+from app.main import app
+from app.services.asset_class_service import AssetClassClient
+from app.services.commitment_service import CommitmentClient
+from app.services.investor_service import InvestorClient
 from tests.factories.asset_class import make_asset_classes
 from tests.factories.commitment import make_commitments
 from tests.factories.investor import make_investors
 
 
+@dataclass(frozen=True, slots=True)
+class FakeResponse:
+    """Plain stand-in for the httpx.Response attributes the clients read."""
+    status: int = 200
+    json_data: Any = None
+
+    @property
+    def status_code(self) -> int:
+        return self.status
+
+    @property
+    def content(self) -> bytes:
+        return orjson.dumps(self.json_data)
+
+    @property
+    def text(self) -> str:
+        return self.content.decode()
+
+    def json(self) -> Any:
+        return self.json_data
+
+
+_NOT_FOUND_RESPONSE = FakeResponse(status=404)
+
+
+class StubMethod:
+    """
+    Awaitable stand-in for one client method.
+
+    Set return_value or side_effect as on a mock.
+    """
+    __slots__ = ("return_value", "side_effect", "call_count")
+
+    def __init__(self, return_value: Any = None):
+        self.return_value = return_value
+        self.side_effect: Optional[BaseException] = None
+        self.call_count = 0
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.call_count += 1
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.return_value
+
+
+class StubInvestorClient:
+    """InvestorClient stub serving a fixed payload."""
+
+    def __init__(self, payload: dict):
+        self.get_all_investors = StubMethod(payload)
+        self.get_investor = StubMethod(payload["investors"][0])
+        self.get_investors = StubMethod(payload["investors"])
+
+
+class StubCommitmentClient:
+    """CommitmentClient stub serving a fixed payload."""
+
+    def __init__(self, payload: dict):
+        self.get_commitments = StubMethod(payload)
+
+
+class StubAssetClassClient:
+    """AssetClassClient stub serving a fixed payload."""
+
+    def __init__(self, payload: list):
+        self.get_asset_classes = StubMethod(payload)
+
+
+def pytest_collection_modifyitems(items):
+    """Run every async test on one session-scoped event loop."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest.fixture(scope="session")
+def test_client():
+    """
+    TestClient shared by the session; lifespan runs once.
+
+    A throwaway query warms the GraphQL stack so the first test isn't
+    charged for it.
+    """
+    with TestClient(app) as client:
+        client.post("/graphql", json={"query": "{ __typename }"})
+        yield client
+
+
+@pytest.fixture(scope="session")
+def investor_client():
+    """InvestorClient shared by the session."""
+    return InvestorClient()
+
+
+@pytest.fixture(scope="session")
+def commitment_client():
+    """CommitmentClient shared by the session."""
+    return CommitmentClient()
+
+
+@pytest.fixture(scope="session")
+def _shared_asset_class_client():
+    return AssetClassClient()
+
+
 @pytest.fixture
-def mock_investor_client():
-    """Mock InvestorClient for testing."""
-    client = AsyncMock()
-    investor_payload = make_investors()
+def asset_class_client(_shared_asset_class_client):
+    """AssetClassClient shared by the session, with its lookup cache emptied per test."""
+    _shared_asset_class_client._cache.clear()
+    return _shared_asset_class_client
+
+
+@pytest.fixture(scope="session")
+def investor_payload():
+    """Investors payload built once per session; treat as read-only."""
+    return make_investors()
+
+
+@pytest.fixture(scope="session")
+def commitment_payload():
+    """Commitments payload built once per session; treat as read-only."""
+    return make_commitments()
 
-    client.get_all_investors.return_value = investor_payload
-    client.get_investor.return_value = investor_payload["investors"][0]
 
-    return client
+@pytest.fixture(scope="session")
+def asset_class_payload():
+    """Asset classes payload built once per session; treat as read-only."""
+    return make_asset_classes()
 
 
 @pytest.fixture
-def mock_commitment_client():
-    """Mock CommitmentClient using factory-generated commitments."""
-    client = AsyncMock()
-    client.get_commitments.return_value = make_commitments()
-    return client
+def mock_investor_client(investor_payload):
+    """Stub InvestorClient for testing."""
+    return StubInvestorClient(investor_payload)
 
 
 @pytest.fixture
-def mock_asset_class_client():
-    """Mock AssetClassClient using factory-generated asset classes."""
-    client = AsyncMock()
-    client.get_asset_classes.return_value = make_asset_classes()
-    return client
+def mock_commitment_client(commitment_payload):
+    """Stub CommitmentClient using factory-generated commitments."""
+    return StubCommitmentClient(commitment_payload)
 
 
 @pytest.fixture
-def mock_httpx_response_factory():
+def mock_asset_class_client(asset_class_payload):
+    """Stub AssetClassClient using factory-generated asset classes."""
+    return StubAssetClassClient(asset_class_payload)
+
+
+@pytest.fixture
+def patched_commitment_clients(monkeypatch, mock_investor_client, mock_commitment_client,
+                               mock_asset_class_client):
     """
-    Factory to create a mocked httpx.AsyncClient response.
+    Point the commitment resolver and the loaders get_context builds at the stub clients.
     """
-    def _make_mock_response(status: int = 200, json_data=None):
-        response = AsyncMock()
-        response.status_code = status
-        response.json = MagicMock(return_value=json_data)
-        return response
+    import app.main as main_module
+    import app.schema.commitments as commitments_schema
 
-    return _make_mock_response
+    monkeypatch.setattr(commitments_schema, "get_commitment_client",
+                        lambda: mock_commitment_client)
+    monkeypatch.setattr(main_module, "get_investor_client",
+                        lambda: mock_investor_client)
+    monkeypatch.setattr(main_module, "get_asset_class_client",
+                        lambda: mock_asset_class_client)
+
+
+@pytest.fixture
+def graphql_info(mock_investor_client, mock_asset_class_client):
+    """Resolver info whose context holds loaders over the stub clients, as get_context builds it."""
+    return SimpleNamespace(context={
+        "asset_class_loader": create_asset_class_loader(mock_asset_class_client),
+        "investor_loader": create_investor_loader(mock_investor_client),
+        "request_cache": {}
+    })
+
+
+@pytest.fixture
+def mock_httpx_response_factory():
+    """
+    Factory to create a stand-in httpx response.
+    """
+    return FakeResponse
 
 
 @pytest.fixture
 def mock_httpx_404_response():
     """Mock 404 response."""
-    response = AsyncMock()
-    response.status_code = 404
-    return response
+    return _NOT_FOUND_RESPONSE
 
 
 @pytest.fixture
@@ -1,38 +1,59 @@
-from typing import List, Optional
-
-from faker import Faker
-
-fake = Faker()
+import copy
+from functools import lru_cache
+from typing import Dict, List, Optional
 
 
 def make_commitments(commitments: Optional[List[dict]] = None):
     """Commitments factory"""
     if commitments is None:
-        commitments = [
-            {
-                "id": "com-1",
-                "investor_id": "inv-1",
-                "asset_class_id": "ac-1",
-                "amount": 1_000_000.0,
-                "currency": "USD",
-                "created_at": "2024-01-01T00:00:00Z",
-                "updated_at": "2024-01-01T00:00:00Z"
-            },
-            {
-                "id": "com-2",
-                "investor_id": "inv-1",
-                "asset_class_id": "ac-2",
-                "amount": 500_000.0,
-                "currency": "USD",
-                "created_at": "2024-01-02T00:00:00Z",
-                "updated_at": "2024-01-02T00:00:00Z"
-            }
-        ]
-
-    total_amount = sum(float(c.get("amount", 0)) for c in commitments)
+        return copy.deepcopy(_default_commitments())
+    return _build_commitments(commitments)
+
+
+@lru_cache(maxsize=1)
+def _default_commitments() -> dict:
+    return _build_commitments([
+        {
+            "id": "com-1",
+            "investor_id": "inv-1",
+            "asset_class_id": "ac-1",
+            "amount": 1_000_000.0,
+            "currency": "USD",
+            "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": "2024-01-01T00:00:00Z"
+        },
+        {
+            "id": "com-2",
+            "investor_id": "inv-1",
+            "asset_class_id": "ac-2",
+            "amount": 500_000.0,
+            "currency": "USD",
+            "created_at": "2024-01-02T00:00:00Z",
+            "updated_at": "2024-01-02T00:00:00Z"
+        }
+    ])
+
+
+def _build_commitments(commitments: List[dict]) -> dict:
+    total_amount = sum([float(c.get("amount", 0)) for c in commitments])
+
+    # One breakdown per asset class, as the commitment service reports them.
+    by_asset_class: Dict[str, List[float]] = {}
+    for c in commitments:
+        by_asset_class.setdefault(c["asset_class_id"], []).append(float(c.get("amount", 0)))
+    asset_breakdowns = [
+        {
+            "asset_class_id": asset_class_id,
+            "total_amount": sum(amounts),
+            "commitment_count": len(amounts),
+            "percentage_of_total": round(sum(amounts) * 100 / total_amount, 2) if total_amount else 0.0
+        }
+        for asset_class_id, amounts in by_asset_class.items()
+    ]
 
     return {
         "commitments": commitments,
+        "asset_breakdowns": asset_breakdowns,
         "total": len(commitments),
         "total_amount": total_amount,
         "page": 1,
@@ -1,33 +1,74 @@
+import copy
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, cast
 
-from faker import Faker
-
-fake = Faker()
+_STATIC_NAMES = ("Acme Capital", "Beta Partners", "Cedar Holdings", "Delta Pension Trust")
+_STATIC_TYPES = ("Pension Fund", "Insurance Company", "Family Office")
+_STATIC_COUNTRIES = ("United Kingdom", "United States", "Germany", "Japan")
+_STATIC_DATE = "2024-01-01"
+_STATIC_TIMESTAMP = "2024-01-01T00:00:00"
 
 
 def make_investors(
     count: int = 2,
     overrides: Optional[List[Dict[str, Any]]] = None,
-    meta: Optional[Dict[str, Any]] = None
+    meta: Optional[Dict[str, Any]] = None,
+    use_faker: bool = False
 ) -> Dict[str, Any]:
     """
     Generate a fake investors response payload.
+
+    Values are deterministic constants unless use_faker is set; the plain
+    default payload is built once per count and copied.
     """
+    if not overrides and meta is None and not use_faker:
+        return copy.deepcopy(_default_investors(count))
+    return _build_investors(count, overrides, meta, use_faker)
+
+
+@lru_cache(maxsize=None)
+def _default_investors(count: int) -> Dict[str, Any]:
+    return _build_investors(count, None, None, False)
+
+
+def _build_investors(
+    count: int,
+    overrides: Optional[List[Dict[str, Any]]],
+    meta: Optional[Dict[str, Any]],
+    use_faker: bool
+) -> Dict[str, Any]:
     investors = []
     overrides = overrides or []
 
+    if use_faker:
+        from faker import Faker
+        fake = Faker()
+
     for i in range(count):
-        base = {
-            "id": f"inv-{i + 1}",
-            "name": fake.company(),
-            "investor_type": fake.random_element(["Pension Fund", "Insurance Company", "Family Office"]),
-            "country": fake.country(),
-            "date_added": fake.date(),
-            "commitment_count": fake.random_int(min=1, max=5),
-            "total_commitment_amount": fake.random_number(digits=6),
-            "created_at": fake.date_time().isoformat(),
-            "updated_at": fake.date_time().isoformat()
-        }
+        if use_faker:
+            base = {
+                "id": f"inv-{i + 1}",
+                "name": fake.company(),
+                "investor_type": fake.random_element(list(_STATIC_TYPES)),
+                "country": fake.country(),
+                "date_added": fake.date(),
+                "commitment_count": fake.random_int(min=1, max=5),
+                "total_commitment_amount": fake.random_number(digits=6),
+                "created_at": fake.date_time().isoformat(),
+                "updated_at": fake.date_time().isoformat()
+            }
+        else:
+            base = {
+                "id": f"inv-{i + 1}",
+                "name": _STATIC_NAMES[i % len(_STATIC_NAMES)],
+                "investor_type": _STATIC_TYPES[i % len(_STATIC_TYPES)],
+                "country": _STATIC_COUNTRIES[i % len(_STATIC_COUNTRIES)],
+                "date_added": _STATIC_DATE,
+                "commitment_count": i % 5 + 1,
+                "total_commitment_amount": 100_000 * (i + 1),
+                "created_at": _STATIC_TIMESTAMP,
+                "updated_at": _STATIC_TIMESTAMP
+            }
 
         if i < len(overrides):
             base.update(overrides[i])
@@ -35,8 +76,7 @@ def make_investors(
         investors.append(base)
 
     total_commitment_amount = sum(
-        cast(float, i["total_commitment_amount"]) for i in investors if "total_commitment_amount" in i
-    )
+        [cast(float, i["total_commitment_amount"]) for i in investors])
 
     default_meta = {
         "total_commitment_amount": total_commitment_amount,
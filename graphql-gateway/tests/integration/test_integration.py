@@ -1,27 +1,64 @@
 from unittest.mock import patch
 
+import orjson
 import pytest
-from fastapi.testclient import TestClient
 
-from app.main import app
+JSON_HEADERS = {"content-type": "application/json"}
+
+INVESTORS_QUERY = """
+query {
+    investors(page: 1, size: 20) {
+        investors {
+            id
+            name
+            investorType
+            country
+            commitmentCount
+            totalCommitmentAmount
+        }
+        totalCommitmentAmount
+        total
+        page
+        size
+    }
+}
+"""
+
+BREAKDOWN_QUERY = """
+query {
+    commitmentBreakdown(investorId: "inv-1") {
+        investorId
+        investorName
+        totalCommitmentAmount
+        commitments {
+            id
+            name
+            amount
+            percentage
+        }
+        assets {
+            id
+            name
+        }
+    }
+}
+"""
 
 
 class TestGraphQLIntegration:
     """Integration tests for GraphQL endpoint."""
 
-    def test_health_check(self):
+    def test_health_check(self, test_client):
         """Test health check endpoint."""
-        client = TestClient(app)
-        response = client.get("/health")
+        response = test_client.get("/health")
 
         assert response.status_code == 200
         assert response.json()["status"] == "healthy"
         assert response.json()["service"] == "GraphQL Gateway"
 
-    def test_root_endpoint(self):
+    def test_root_endpoint(self, test_client):
         """Test root endpoint."""
-        client = TestClient(app)
-        response = client.get("/")
+        response = test_client.get("/")
 
         assert response.status_code == 200
         data = response.json()
@@ -30,34 +67,14 @@ class TestGraphQLIntegration:
         assert len(data["queries"]) > 0
 
     @pytest.mark.asyncio
-    async def test_graphql_investors_query(self, mock_investor_client):
+    async def test_graphql_investors_query(self, test_client, mock_investor_client):
         """Test GraphQL investors query."""
         with patch('app.schema.investors.get_investor_client', return_value=mock_investor_client):
-            client = TestClient(app)
-
-            query = """
-            query {
-                investors(page: 1, size: 20) {
-                    investors {
-                        id
-                        name
-                        investorType
-                        country
-                        commitmentCount
-                        totalCommitmentAmount
-                    }
-                    totalCommitmentAmount
-                    total
-                    page
-                    size
-                }
-            }
-            """
-
-            response = client.post("/graphql", json={"query": query})
+            response = test_client.post(
+                "/graphql", content=orjson.dumps({"query": INVESTORS_QUERY}), headers=JSON_HEADERS)
             assert response.status_code == 200
 
-            data = response.json()["data"]["investors"]
+            data = orjson.loads(response.content)["data"]["investors"]
 
             expected_amount = sum(i["total_commitment_amount"]
                                   for i in mock_investor_client.get_all_investors.return_value["investors"])
@@ -65,39 +82,14 @@ class TestGraphQLIntegration:
             assert data["totalCommitmentAmount"] == expected_amount
 
     @pytest.mark.asyncio
-    async def test_graphql_commitment_breakdown_query(self, mock_investor_client, mock_commitment_client, mock_asset_class_client):
+    async def test_graphql_commitment_breakdown_query(self, test_client, patched_commitment_clients):
         """Test GraphQL commitment breakdown query."""
-        with patch('app.schema.commitments.get_investor_client', return_value=mock_investor_client), \
-                patch('app.schema.commitments.get_commitment_client', return_value=mock_commitment_client), \
-                patch('app.schema.commitments.get_asset_class_client', return_value=mock_asset_class_client):
-
-            client = TestClient(app)
-
-            query = """
-            query {
-                commitmentBreakdown(investorId: "inv-1") {
-                    investorId
-                    investorName
-                    totalCommitmentAmount
-                    commitments {
-                        id
-                        name
-                        amount
-                        percentage
-                    }
-                    assets {
-                        id
-                        name
-                    }
-                }
-            }
-            """
-
-            response = client.post("/graphql", json={"query": query})
-            assert response.status_code == 200
+        response = test_client.post(
+            "/graphql", content=orjson.dumps({"query": BREAKDOWN_QUERY}), headers=JSON_HEADERS)
+        assert response.status_code == 200
 
-            data = response.json()["data"]["commitmentBreakdown"]
-            assert data["investorId"] == "inv-1"
-            assert data["totalCommitmentAmount"] == 1500000.0
-            assert len(data["commitments"]) == 2
-            assert len(data["assets"]) == 2
+        data = orjson.loads(response.content)["data"]["commitmentBreakdown"]
+        assert data["investorId"] == "inv-1"
+        assert data["totalCommitmentAmount"] == 1500000.0
+        assert len(data["commitments"]) == 2
+        assert len(data["assets"]) == 2
@@ -0,0 +1,17 @@
+import inspect
+
+from app.schema import Query
+
+
+class TestQuerySchema:
+    """Test cases for the root query type."""
+
+    def test_all_resolvers_are_async(self):
+        """Sync resolvers would run on the thread pool and serialize requests."""
+        resolvers = [field.base_resolver
+                     for field in Query.__strawberry_definition__.fields
+                     if field.base_resolver is not None]
+
+        assert resolvers
+        for resolver in resolvers:
+            assert inspect.iscoroutinefunction(resolver.wrapped_func), resolver.name
@@ -1,8 +1,8 @@
+import asyncio
 from unittest.mock import patch
 
 import pytest
 
-from app.services.asset_class_service import AssetClassClient
 from tests.factories.asset_class import make_asset_classes
 
 
@@ -10,21 +10,38 @@ class TestAssetClassClient:
     """Test cases for AssetClassClient."""
 
     @pytest.mark.asyncio
-    async def test_get_asset_classes_success(self, mock_httpx_response_factory):
+    async def test_get_asset_classes_success(self, asset_class_client, mock_httpx_response_factory):
         """Test get asset classes"""
-        client = AssetClassClient()
-
         asset_classes = make_asset_classes()
         mock_response = mock_httpx_response_factory(
             status=200, json_data=asset_classes)
 
-        with patch.object(client.client, 'post', return_value=mock_response) as mock_post:
-            result = await client.get_asset_classes(["ac-1", "ac-2"])
+        with patch.object(asset_class_client.client, 'post', return_value=mock_response) as mock_post:
+            result = await asset_class_client.get_asset_classes(["ac-1", "ac-2"])
 
             assert result == asset_classes
             mock_post.assert_called_once_with(
-                f"{client.base_url}/api/asset-classes/bulk",
+                f"{asset_class_client.base_url}/api/asset-classes/bulk",
                 json=["ac-1", "ac-2"]
             )
 
-        await client.close()
+    @pytest.mark.asyncio
+    async def test_get_asset_classes_coalesces_concurrent_misses(self, asset_class_client,
+                                                                 mock_httpx_response_factory):
+        """Test concurrent misses for the same IDs share one bulk request."""
+        asset_classes = make_asset_classes()
+        release = asyncio.Event()
+
+        async def slow_post(*args, **kwargs):
+            await release.wait()
+            return mock_httpx_response_factory(status=200, json_data=asset_classes)
+
+        with patch.object(asset_class_client.client, 'post', side_effect=slow_post) as mock_post:
+            first = asyncio.create_task(asset_class_client.get_asset_classes(["ac-1", "ac-2"]))
+            second = asyncio.create_task(asset_class_client.get_asset_classes(["ac-2", "ac-1"]))
+            await asyncio.sleep(0)
+            release.set()
+
+            assert await first == asset_classes
+            assert sorted(ac["id"] for ac in await second) == ["ac-1", "ac-2"]
+            mock_post.assert_called_once()
@@ -2,7 +2,6 @@ from unittest.mock import patch
 
 import pytest
 
-from app.services.commitment_service import CommitmentClient
 from tests.factories.commitment import make_commitments
 
 
@@ -10,8 +9,7 @@ class TestCommitmentClient:
     """Test cases for CommitmentClient."""
 
     @pytest.mark.asyncio
-    async def test_get_commitments_success(self, mock_httpx_response_factory):
-        client = CommitmentClient()
+    async def test_get_commitments_success(self, commitment_client, mock_httpx_response_factory):
         expected_data = make_commitments()
 
         mock_response = mock_httpx_response_factory(
@@ -19,8 +17,6 @@ class TestCommitmentClient:
             json_data=expected_data
         )
 
-        with patch.object(client.client, 'get', return_value=mock_response):
-            result = await client.get_commitments("inv-1")
+        with patch.object(commitment_client.client, 'get', return_value=mock_response):
+            result = await commitment_client.get_commitments("inv-1")
             assert result == expected_data
-
-        await client.close()
@@ -1,8 +1,9 @@
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from app.services.investor_service import InvestorClient
+from app.config import settings
+from app.services import close_shared_http_client
 from tests.factories.investor import make_investors
 
 
@@ -10,39 +11,41 @@ class TestInvestorClientService:
     """Test cases for InvestorClient."""
 
     @pytest.mark.asyncio
-    async def test_get_all_investors_success(self, mock_httpx_response_factory):
+    async def test_get_all_investors_success(self, investor_client, mock_httpx_response_factory):
         """Test successful get_all_investors call."""
-        client = InvestorClient()
         expected_data = make_investors(count=1)
 
         mock_response = mock_httpx_response_factory(
             status=200, json_data=expected_data
         )
 
-        with patch.object(client.client, 'get', return_value=mock_response):
-            result = await client.get_all_investors(1, 20)
+        with patch.object(investor_client.client, 'get', return_value=mock_response):
+            result = await investor_client.get_all_investors(1, 20)
             assert result == expected_data
 
-        await client.close()
-
     @pytest.mark.asyncio
-    async def test_get_investor_not_found(self, mock_httpx_404_response):
+    async def test_get_investor_not_found(self, investor_client, mock_httpx_404_response):
         """Test get_investor with 404 response."""
-        client = InvestorClient()
-
-        with patch.object(client.client, 'get', return_value=mock_httpx_404_response):
-            result = await client.get_investor("invalid-id")
+        with patch.object(investor_client.client, 'get', return_value=mock_httpx_404_response):
+            result = await investor_client.get_investor("invalid-id")
             assert result is None
 
-        await client.close()
-
     @pytest.mark.asyncio
-    async def test_get_investor_network_error(self, mock_httpx_network_error):
+    async def test_get_investor_network_error(self, investor_client, mock_httpx_network_error):
         """Test get_investor with network error."""
-        client = InvestorClient()
-
-        with patch.object(client.client, 'get', side_effect=mock_httpx_network_error):
-            result = await client.get_investor("inv-1")
+        with patch.object(investor_client.client, 'get', side_effect=mock_httpx_network_error) as mock_get, \
+                patch('app.utils.retry.asyncio.sleep', new_callable=AsyncMock):
+            result = await investor_client.get_investor("inv-1")
             assert result is None
+            assert mock_get.call_count == settings.max_retries + 1
+
+    @pytest.mark.asyncio
+    async def test_client_survives_shared_client_close(self, investor_client):
+        """Test the client uses a fresh shared client after the old one is closed."""
+        closed_client = investor_client.client
+
+        await close_shared_http_client()
 
-        await client.close()
+        assert closed_client.is_closed
+        assert investor_client.client is not closed_client
+        assert not investor_client.client.is_closed
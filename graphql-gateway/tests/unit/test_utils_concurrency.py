@@ -0,0 +1,43 @@
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from app.utils.concurrency import AdaptiveConcurrencyLimiter
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Test cases for AdaptiveConcurrencyLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_success_grows_limit(self, mock_httpx_response_factory):
+        """Test successful requests raise the limit additively."""
+        limiter = AdaptiveConcurrencyLimiter("test", 4, 128)
+        response = mock_httpx_response_factory(status=200, json_data={})
+
+        result = await limiter.run(AsyncMock(return_value=response))
+
+        assert result is response
+        assert limiter.limit == pytest.approx(4.25)
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_overload_status_halves_limit(self, mock_httpx_response_factory):
+        """Test a 503 halves the limit."""
+        limiter = AdaptiveConcurrencyLimiter("test", 8, 128)
+
+        await limiter.run(AsyncMock(return_value=mock_httpx_response_factory(status=503)))
+
+        assert limiter.limit == 4
+
+    @pytest.mark.asyncio
+    async def test_timeout_halves_limit_and_reraises(self):
+        """Test timeouts count as overload and propagate."""
+        limiter = AdaptiveConcurrencyLimiter("test", 2, 128)
+        send = AsyncMock(side_effect=httpx.ReadTimeout("timed out"))
+
+        with pytest.raises(httpx.ReadTimeout):
+            await limiter.run(send)
+
+        assert limiter.limit == 1
+        assert limiter.in_flight == 0
@@ -0,0 +1,47 @@
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app.utils.retry import retry_request
+
+
+class TestRetryRequest:
+    """Test cases for retry_request."""
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_status(self, mock_httpx_response_factory):
+        """Test a 503 is retried until the upstream recovers."""
+        unavailable = mock_httpx_response_factory(status=503)
+        ok = mock_httpx_response_factory(status=200, json_data={})
+        send = AsyncMock(side_effect=[unavailable, ok])
+
+        with patch('app.utils.retry.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            result = await retry_request(send, retries=3, base_delay=0.1)
+
+        assert result is ok
+        assert send.call_count == 2
+        mock_sleep.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_client_errors(self, mock_httpx_404_response):
+        """Test non-transient responses are returned straight away."""
+        send = AsyncMock(return_value=mock_httpx_404_response)
+
+        with patch('app.utils.retry.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            result = await retry_request(send, retries=3, base_delay=0.1)
+
+        assert result is mock_httpx_404_response
+        send.assert_awaited_once()
+        mock_sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_raises_after_retries_exhausted(self, mock_httpx_network_error):
+        """Test the last network error is raised once retries run out."""
+        send = AsyncMock(side_effect=mock_httpx_network_error)
+
+        with patch('app.utils.retry.asyncio.sleep', new_callable=AsyncMock):
+            with pytest.raises(httpx.RequestError):
+                await retry_request(send, retries=2, base_delay=0.1)
+
+        assert send.call_count == 3
@@ -12,6 +12,8 @@ import httpx
 
 logger = logging.getLogger(__name__)
 
+ASSET_CLASS_PAGE_LIMIT = 1000
+
 
 class AssetClassData(TypedDict):
     """Shape of asset class data passed to bulk_create_asset_classes."""
@@ -30,6 +32,14 @@ class AssetClassListResponse(TypedDict):
     updated_at: str
 
 
+class AssetClassPageResponse(TypedDict):
+    """Page from the asset class service list endpoint."""
+    data: List[AssetClassListResponse]
+    total: int
+    page: int
+    size: int
+
+
 class AssetClassCreateResponse(TypedDict):
     """Response from individual asset class create endpoint."""
     data: AssetClassListResponse
@@ -84,10 +94,28 @@ class AssetClassManager:
         name_to_id: Dict[str, str] = {}
 
         try:
-            response = await self.client.get(
-                f"{self.asset_class_url}/api/asset-classes/")
+            # Page through the whole catalog; a single page would miss any
+            # asset class beyond the first ASSET_CLASS_PAGE_LIMIT.
+            skip = 0
+            asset_classes: List[AssetClassListResponse] = []
+
+            while True:
+                response = await self.client.get(
+                    f"{self.asset_class_url}/api/asset-classes/",
+                    params={"skip": skip, "limit": ASSET_CLASS_PAGE_LIMIT})
 
-            asset_classes: List[AssetClassListResponse] = response.json()
+                if response.status_code != 200:
+                    logger.error("Failed to fetch existing asset classes: HTTP %d - %s",
+                                 response.status_code, response.text)
+                    break
+
+                data: AssetClassPageResponse = response.json()
+                page = data.get('data', [])
+                asset_classes.extend(page)
+
+                skip += len(page)
+                if not page or skip >= data.get('total', 0):
+                    break
 
             if not asset_classes:
                 logger.warning("No asset classes found in the system")
@@ -117,12 +145,8 @@ class AssetClassManager:
         name_to_id: Dict[str, str] = {}
 
         try:
-            asset_classes_list: List[AssetClassData] = []
-            name_order: List[str] = []
-
-            for name, data in asset_classes.items():
-                asset_classes_list.append(data)
-                name_order.append(name)
+            asset_classes_list: List[AssetClassData] = list(
+                asset_classes.values())
 
             logger.info("Bulk creating %d asset classes in single request", len(
                 asset_classes_list))
@@ -136,15 +160,16 @@ class AssetClassManager:
                 created_asset_classes: List[AssetClassListResponse] = response.json(
                 )
 
+                # The bulk endpoint skips documents that fail to insert, so
+                # match results by name rather than by position.
                 if isinstance(created_asset_classes, list):
-                    for i, created_asset_class in enumerate(created_asset_classes):
-                        if i < len(name_order):
-                            name = name_order[i]
-                            asset_class_id = created_asset_class.get('id')
-                            if asset_class_id:
-                                name_to_id[name] = asset_class_id
-                                logger.debug("Bulk created asset class: %s -> %s",
-                                             name, asset_class_id)
+                    for created_asset_class in created_asset_classes:
+                        name = created_asset_class.get('name')
+                        asset_class_id = created_asset_class.get('id')
+                        if name in asset_classes and asset_class_id:
+                            name_to_id[name] = asset_class_id
+                            logger.debug("Bulk created asset class: %s -> %s",
+                                         name, asset_class_id)
 
                 logger.info("Successfully bulk created %d/%d asset classes",
                             len(name_to_id), len(asset_classes))
@@ -108,6 +108,49 @@ async def bulk_create_investors(
         ) from e
 
 
+@router.post(
+    "/batch",
+    response_model=List[InvestorResponse],
+    summary="Bulk get investors",
+    description="Fetch multiple investors by ID in a single request."
+)
+async def batch_get_investors(
+    investor_ids: List[str] = Body(...,
+                                   description="List of investor IDs to fetch"),
+    repo: InvestorRepository = Depends(get_investor_repository)
+) -> List[InvestorResponse]:
+    """
+    Bulk fetch investors by their IDs; missing IDs are left out.
+    """
+    try:
+        if not investor_ids:
+            return []
+
+        if len(investor_ids) > 100:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Maximum 100 investor IDs allowed per batch request"
+            )
+
+        logger.info("Batch fetching %d investors", len(investor_ids))
+
+        investors = await repo.get_by_ids(investor_ids)
+
+        logger.info("Successfully fetched %d/%d investors",
+                    len(investors), len(investor_ids))
+
+        return investors
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Error batch fetching investors: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error while batch fetching investors"
+        ) from e
+
+
 @router.get(
     "/{investor_id}",
     response_model=InvestorResponse,
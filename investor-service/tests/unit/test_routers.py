@@ -3,8 +3,8 @@ from unittest.mock import AsyncMock
 import pytest
 from fastapi import HTTPException, status
 
-from app.routers.investors import (bulk_create_investors, create_investor,
-                                   get_investor, get_investors)
+from app.routers.investors import (batch_get_investors, bulk_create_investors,
+                                   create_investor, get_investor, get_investors)
 from tests.factories.investor import (InvestorCreateFactory,
                                       InvestorResponseFactory)
 
@@ -48,4 +48,26 @@ class TestInvestorRouters:
 
         assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
         assert "Investor with ID non-existent not found" in str(
-            exc_info.value.detail)
\ No newline at end of file
+            exc_info.value.detail)
+
+    @pytest.mark.asyncio
+    async def test_batch_get_investors(self):
+        """Test fetching several investors by ID in one request."""
+        mock_responses = InvestorResponseFactory.build_batch(2)
+
+        mock_repo = AsyncMock()
+        mock_repo.get_by_ids.return_value = mock_responses
+
+        ids = [investor.id for investor in mock_responses]
+        result = await batch_get_investors(ids, mock_repo)
+
+        assert result == mock_responses
+        mock_repo.get_by_ids.assert_called_once_with(ids)
+
+    @pytest.mark.asyncio
+    async def test_batch_get_investors_too_many_ids(self):
+        """Test batch requests over the ID limit are rejected."""
+        with pytest.raises(HTTPException) as exc_info:
+            await batch_get_investors([f"inv-{i}" for i in range(101)], AsyncMock())
+
+        assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST